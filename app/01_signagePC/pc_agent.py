@@ -1,11 +1,13 @@
 import argparse
 import json
+import mmap
 import os
 import shutil
 import socket
 import subprocess
 import time
 import sys
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -15,6 +17,11 @@ try:
 except ImportError:
     psutil = None
 
+try:
+    from watchfiles import watch
+except ImportError:
+    watch = None
+
 JST = timezone(timedelta(hours=9))
 ROOT = Path(__file__).resolve().parents[2]
 APP_DIR = ROOT / "app"
@@ -22,7 +29,7 @@ COMMON_DIR = APP_DIR / "10_common"
 if str(COMMON_DIR) not in sys.path:
     sys.path.insert(0, str(COMMON_DIR))
 
-from json_io import write_json_safe
+from json_io import loads_json, write_json_safe
 CONFIG_DIR = APP_DIR / "11_config"
 CONTENT_DIR = ROOT / "content"
 LOGS_DIR = ROOT / "logs"
@@ -30,6 +37,17 @@ RUNTIME_DIR = ROOT / "runtime"
 STATUS_DIR = LOGS_DIR / "status"
 
 PYTHON_EXE = RUNTIME_DIR / "python" / "python.exe"
+# PATH 検索を避けるため shutdown.exe は絶対パスで固定し、argv も起動時に組み立てておく
+SHUTDOWN_EXE = os.environ.get("SystemRoot", r"C:\Windows") + r"\System32\shutdown.exe"
+_SHUTDOWN_ARGV = {
+    "shutdown": (SHUTDOWN_EXE, "/s", "/t", "0"),
+    "reboot": (SHUTDOWN_EXE, "/r", "/t", "0"),
+}
+
+# command.json の処理は通知スレッドと main() のポーリングの両方から呼ばれ得る
+_command_lock = threading.Lock()
+# 最後に見た command.json の (mtime_ns, size)。同じなら JSON を読まない
+_last_command_stat: Optional[tuple[int, int]] = None
 
 
 def now_iso() -> str:
@@ -50,8 +68,8 @@ def log_line(log_path: str, msg: str) -> None:
         pass
 
 
-def write_json_status(path: str | Path, payload: dict, log_path: Path) -> None:
-    ok, retry_count, err = write_json_safe(path, payload, indent=2, ensure_ascii=False)
+def write_json_status(path: str | Path, payload: dict, log_path: Path, *, fsync: bool = True) -> None:
+    ok, retry_count, err = write_json_safe(path, payload, indent=2, ensure_ascii=False, fsync=fsync)
     if ok and retry_count > 0:
         log_line(str(log_path), f"WARN: JSON write retry succeeded ({retry_count} retries): {path}")
     if not ok:
@@ -62,8 +80,25 @@ def read_json_safe(path: Path) -> Optional[dict]:
     if not path.is_file():
         return None
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return loads_json(path.read_bytes())
+    except Exception:
+        return None
+
+
+def read_json_mmap(path: Path) -> Optional[dict]:
+    """
+    command.json 用。mmap したページを memoryview のまま JSON パーサへ渡す（中間バッファなし）。
+    """
+    try:
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return loads_json(view)
+                finally:
+                    view.release()
     except Exception:
         return None
 
@@ -75,8 +110,7 @@ def read_json_with_error(path: Path, *, retries: int = 3) -> tuple[Optional[dict
     last_err: Exception | None = None
     for i in range(max(1, int(retries))):
         try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f), None
+            return loads_json(path.read_bytes()), None
         except (PermissionError, OSError) as e:
             last_err = e
             time.sleep(min(0.2, 0.05 * (2 ** i)))
@@ -179,18 +213,97 @@ def read_player_heartbeat(path: Path, now_dt: datetime, stale_sec: int = 60) ->
 
 
 def exec_shutdown(action: str) -> int:
-    if action == "shutdown":
-        cp = subprocess.run(["shutdown", "/s", "/t", "0"], capture_output=True, text=True)
-        return cp.returncode
-    if action == "reboot":
-        cp = subprocess.run(["shutdown", "/r", "/t", "0"], capture_output=True, text=True)
-        return cp.returncode
-    raise ValueError("unknown action")
+    argv = _SHUTDOWN_ARGV.get(action)
+    if argv is None:
+        raise ValueError("unknown action")
+    cp = subprocess.run(argv, capture_output=True, text=True)
+    return cp.returncode
+
+
+def handle_command(cmd_path: Path, cmd_result_path: Path, config_dir: Path, log_path: Path) -> None:
+    global _last_command_stat
+    with _command_lock:
+        try:
+            st = os.stat(cmd_path)
+        except OSError:
+            return
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == _last_command_stat:
+            return
+        _last_command_stat = stat_key
+        try:
+            cmd = read_json_mmap(Path(cmd_path))
+            if cmd is None:
+                # 書込み途中の可能性があるので消費しない（次の更新で stat が変われば読み直す）
+                log_line(log_path, f"WARN: command.json unreadable, waiting for next update: {cmd_path}")
+                return
+            if not isinstance(cmd, dict):
+                cmd = {}
+            action = (cmd.get("action") or cmd.get("command") or "").lower().strip()
+            force = bool(cmd.get("force", False))
+
+            if action in ("shutdown", "reboot") and force:
+                rc = exec_shutdown(action)
+                result = {
+                    "timestamp": now_iso(),
+                    "action": action,
+                    "executed": True,
+                    "returncode": rc,
+                    "note": "command executed",
+                }
+            else:
+                result = {
+                    "timestamp": now_iso(),
+                    "action": action,
+                    "executed": False,
+                    "returncode": None,
+                    "note": "ignored (action invalid or force=false)",
+                }
+
+            # 結果は最終結果の 1 回だけ書く（「受付済み」の中間書込みはしない）
+            write_json_status(cmd_result_path, result, log_path)
+            done_path = os.path.join(config_dir, f"command.done.{int(time.time())}.json")
+            try:
+                os.replace(cmd_path, done_path)
+            except Exception:
+                pass
+
+        except Exception as e:
+            log_line(log_path, f"Command handling error: {e}")
+
+
+def command_watch_loop(
+    cmd_path: Path,
+    cmd_result_path: Path,
+    config_dir: Path,
+    log_path: Path,
+    active: threading.Event,
+    force_polling: bool = False,
+) -> None:
+    """
+    command.json の到着を OS のファイル通知（watchfiles）で待つ。
+    通知が使えなくなった場合は active を落とし、main() 側のポーリングに戻す。
+    active は最初の yield（= OS の監視が登録済み）で立てる。それまでは main() 側のポーリングが続く。
+    """
+    try:
+        for changes in watch(config_dir, force_polling=force_polling, yield_on_timeout=True):
+            if not active.is_set():
+                # 監視開始までの隙間に置かれた command.json は通知が来ないので、ここで 1 回拾う
+                active.set()
+                handle_command(cmd_path, cmd_result_path, config_dir, log_path)
+                continue
+            if any(Path(p).name == cmd_path.name for _, p in changes):
+                handle_command(cmd_path, cmd_result_path, config_dir, log_path)
+    except Exception as e:
+        log_line(log_path, f"WARN: command watch stopped, fallback to polling: {e}")
+    finally:
+        active.clear()
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--interval", type=int, default=5)
+    ap.add_argument("--force-polling", action="store_true", help="watchfiles をポーリングモードで使う（共有フォルダ等）")
     args = ap.parse_args()
 
     status_dir = STATUS_DIR
@@ -222,6 +335,20 @@ def main() -> int:
 
     interval = max(1, int(args.interval))
 
+    # 停止中に届いていた command.json は起動時に1回だけ処理する
+    handle_command(cmd_path, cmd_result_path, config_dir, log_path)
+
+    command_watch_active = threading.Event()
+    if watch is not None:
+        threading.Thread(
+            target=command_watch_loop,
+            args=(cmd_path, cmd_result_path, config_dir, log_path, command_watch_active),
+            kwargs={"force_polling": args.force_polling},
+            daemon=True,
+        ).start()
+    else:
+        log_line(log_path, "WARN: watchfiles is not installed. command.json is polled every loop.")
+
     while True:
         try:
             now_dt = datetime.now(JST)
@@ -291,7 +418,8 @@ def main() -> int:
                     "ssd_total_gb": "shutil" if ssd_total_gb is not None else "none",
                 },
             }
-            write_json_status(status_path, payload, log_path)
+            # pc_status / heartbeat は毎周期上書きするので fsync しない（command_result は fsync する）
+            write_json_status(status_path, payload, log_path, fsync=False)
 
             heartbeat_payload = {
                 "timestamp": now_iso(),
@@ -300,41 +428,10 @@ def main() -> int:
                 "agent_uptime_sec": agent_uptime_sec,
                 "os_uptime_sec": os_uptime_sec,
             }
-            write_json_status(heartbeat_path, heartbeat_payload, log_path)
+            write_json_status(heartbeat_path, heartbeat_payload, log_path, fsync=False)
 
-            if os.path.isfile(cmd_path):
-                try:
-                    cmd = read_json_safe(Path(cmd_path)) or {}
-                    action = (cmd.get("action") or cmd.get("command") or "").lower().strip()
-                    force = bool(cmd.get("force", False))
-
-                    if action in ("shutdown", "reboot") and force:
-                        rc = exec_shutdown(action)
-                        result = {
-                            "timestamp": now_iso(),
-                            "action": action,
-                            "executed": True,
-                            "returncode": rc,
-                            "note": "command executed",
-                        }
-                    else:
-                        result = {
-                            "timestamp": now_iso(),
-                            "action": action,
-                            "executed": False,
-                            "returncode": None,
-                            "note": "ignored (action invalid or force=false)",
-                        }
-
-                    write_json_status(cmd_result_path, result, log_path)
-                    done_path = os.path.join(config_dir, f"command.done.{int(time.time())}.json")
-                    try:
-                        os.replace(cmd_path, done_path)
-                    except Exception:
-                        pass
-
-                except Exception as e:
-                    log_line(log_path, f"Command handling error: {e}")
+            if not command_watch_active.is_set():
+                handle_command(cmd_path, cmd_result_path, config_dir, log_path)
 
         except Exception as e:
             log_line(log_path, f"Loop error: {e}")
@@ -1,9 +1,20 @@
+import asyncio
+import atexit
+import ctypes
+import errno
 import faulthandler
+import functools
+import hashlib
+import heapq
 import json
 import importlib.util
 import inspect
+import itertools
 import logging
 import os
+import random
+import re
+import select
 import shutil
 import socket
 import subprocess
@@ -11,11 +22,11 @@ import sys
 import threading
 import time as time_module
 import traceback
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed, wait
 from dataclasses import dataclass
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
@@ -41,14 +52,31 @@ else:
     Observer = None
     WATCHDOG_AVAILABLE = False
 
+if importlib.util.find_spec("xxhash"):
+    import xxhash
+else:
+    xxhash = None
+
+if importlib.util.find_spec("icmplib"):
+    import icmplib
+else:
+    icmplib = None
+
 APP_NAME = "TsuyamaST SuperAI Signage Controller"
 
+# 呼び出しごとの getLogger を避けるため事前に解決しておく（出力先は root のハンドラ）
+logger = logging.getLogger("signage_controller")
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 _congestion_common = importlib.import_module("10_common.congestion_common")
 level_style = _congestion_common.level_style
+# JSON の読み書きは orjson があれば使う（無ければ標準 json と同じ出力）
+_json_io = importlib.import_module("10_common.json_io")
+loads_json = _json_io.loads_json
+dumps_json = _json_io.dumps_json
 # 事務所側PCは app\11_config を使う
 CONFIG_DIR = ROOT_DIR / "11_config"
 CONTENT_DIR = ROOT_DIR.parent / "content"
@@ -66,19 +94,42 @@ INVENTORY_PATH = CONFIG_DIR / "inventory.json"
 AI_STATUS_PATH = CONFIG_DIR / "ai_status.json"
 SETTINGS_PATH = CONFIG_DIR / "controller_settings.json"
 AI_STATUS_STALE_SEC = 30
+# 次のルール切替が遠くても、この秒数ごとには再計算する（従来の 60 秒周期と同じ）。
+# CONFIG_DIR は監視していないので、ダイアログ外で書き換えた config.json もこの周期で反映される
+TIMER_TRANSITION_MAX_WAIT_SEC = 60
+# 再計算や次回時刻の算出に失敗したときは、この秒数後にやり直す（従来の 60 秒周期と同じ）
+TIMER_TRANSITION_RETRY_SEC = 60
+# 一括処理の先頭でまとめて取った ping 結果を使い回す秒数
+PING_CACHE_SEC = 5.0
+# 共有フォルダ到達確認（ping + tcp445 + UNC exists）の結果を使い回す秒数
+SHARE_REACH_CACHE_SEC = 5.0
+# 通信確認の結果（online/offline）を共有フォルダ到達確認で信用する秒数
+CONNECTIVITY_FRESH_SEC = 10.0
+# tcp445 到達確認の結果を使い回す秒数（通信確認 → 配信 と続けても SYN を打ち直さない）
+TCP_PROBE_CACHE_SEC = 3.0
+# LOG回収で 1 台あたり同時に流すファイルコピー数（小さいファイルが多く、往復待ちが支配的なため）
+LOG_COPY_WORKERS = 4
+# 変化の通知が無くても接続確認を行う最長間隔（秒）
+CONNECTIVITY_HEARTBEAT_SEC = 60.0
+# スレッドダンプに一覧として書き出すスレッド数の上限（ダンプ自体が重くならないように）
+DBG_DUMP_MAX_THREADS = 200
 
 BASE_COL = 1
 N_SIGNAGE = 20
 MAX_CHANNEL = 50
-CHANNELS = [f"ch{idx:02d}" for idx in range(1, MAX_CHANNEL + 1)]
-COMMON_CHANNEL_CHOICES = [f"ch{n:02d}" for n in range(2, 20)]
-NORMAL_CHOICES = COMMON_CHANNEL_CHOICES.copy()
+# チャンネル名は起動時に intern した tuple で固定し、毎 tick の所属判定は frozenset で行う
+CHANNELS = tuple(sys.intern(f"ch{idx:02d}") for idx in range(1, MAX_CHANNEL + 1))
+CHANNEL_SET = frozenset(CHANNELS)
+COMMON_CHANNEL_CHOICES = CHANNELS[1:19]
+NORMAL_CHOICES = COMMON_CHANNEL_CHOICES
+NORMAL_CHOICE_SET = frozenset(NORMAL_CHOICES)
 EMERGENCY_CHANNEL = "ch20"
-TIMER_CHOICES = COMMON_CHANNEL_CHOICES.copy()
+TIMER_CHOICES = COMMON_CHANNEL_CHOICES
+TIMER_CHOICE_SET = frozenset(TIMER_CHOICES)
 AI_SAME_AS_NORMAL_LABEL = "通常時と同じ"
-AI_LEVEL2_CHOICES = [AI_SAME_AS_NORMAL_LABEL] + [f"ch{n:02d}" for n in range(21, 31)]
-AI_LEVEL3_CHOICES = [AI_SAME_AS_NORMAL_LABEL] + [f"ch{n:02d}" for n in range(31, 41)]
-AI_LEVEL4_CHOICES = [AI_SAME_AS_NORMAL_LABEL] + [f"ch{n:02d}" for n in range(41, 51)]
+AI_LEVEL2_CHOICES = (AI_SAME_AS_NORMAL_LABEL,) + CHANNELS[20:30]
+AI_LEVEL3_CHOICES = (AI_SAME_AS_NORMAL_LABEL,) + CHANNELS[30:40]
+AI_LEVEL4_CHOICES = (AI_SAME_AS_NORMAL_LABEL,) + CHANNELS[40:50]
 SLEEP_FIXED = "ch01"
 TIMER_CHANNEL_COLORS = {
     channel: QtGui.QColor.fromHsv(int((idx * 240) / max(1, len(TIMER_CHOICES))), 180, 235)
@@ -96,6 +147,63 @@ PC_STATUS_ITEMS = [
     ("mem_usage", "メモリ使用率[%]"),
     ("c_drive", "Cドライブ（使用/全体）"),
 ]
+# _build_pc_status_values の雛形（毎回内包表記で作らず copy する）
+_PC_STATUS_DEFAULT = {key: "不明" for key, _ in PC_STATUS_ITEMS}
+# 欠けた入れ子項目の代わりに使う空 dict（共有なので書き換えないこと）
+_EMPTY: dict = {}
+
+# プレビュー静止画の QPixmapCache 上限（KB）。同じサンプルを映す列同士で 1 枚を共有する
+PREVIEW_PIXMAP_CACHE_KB = 20 * 1024
+# プレビュー静止画の大きさ（縦横比は保つ）
+PREVIEW_THUMB_WIDTH = 200
+PREVIEW_THUMB_HEIGHT = 120
+# プレビュー静止画（縮小済み JPEG）の保存先。content 配下に置くと同期でサイネージPCへ配られてしまうので別にする
+PREVIEW_POSTER_DIR = ROOT_DIR.parent / "cache" / "preview_posters"
+PREVIEW_POSTER_JPEG_QUALITY = 70
+
+# 端末ごとの失敗理由の分類（上から順に判定。日本語は lower() で変わらないので同じ表で見る）
+RESULT_REASON_RULES = (
+    ("timeout", "timeout"),
+    ("permission", "permission"),
+    ("access", "permission"),
+    ("権限", "permission"),
+    ("アクセス", "permission"),
+    ("json", "json_error"),
+    ("到達不可", "unreachable"),
+    ("unreachable", "unreachable"),
+)
+
+# 注意/危険のしきい値 (warn, danger)。severity = (v >= warn) + (v >= danger)
+SEVERITY_THRESHOLDS = {"load": (70, 90), "temp": (55, 65), "ssd": (80, 90)}
+
+# 状態表示のスタイルシートは起動時に組み立てておき、毎 tick の f-string 生成をしない
+_SEVERITY_COLORS = {0: ("#ffffff", "#111"), 1: ("#ffd6e7", "#111"), 2: ("#e53935", "#fff")}
+STYLE_STATUS = {
+    sev: f"background:{bg}; color:{fg}; border:1px solid #bbb; border-radius:8px; padding:2px 4px;"
+    for sev, (bg, fg) in _SEVERITY_COLORS.items()
+}
+STYLE_STATUS_INACTIVE = "background:#c9c9c9; color:#666; border:1px solid #bbb; border-radius:8px; padding:2px 4px;"
+STYLE_SSD = {
+    sev: f"background:{bg}; color:{fg}; border:1px solid #bbb; border-radius:8px; padding:2px 8px;"
+    for sev, (bg, fg) in _SEVERITY_COLORS.items()
+}
+STYLE_CHIP = {
+    sev: f"background:{bg}; color:{fg}; border:1px solid #bbb; border-radius:8px; font-weight:800;"
+    for sev, (bg, fg) in _SEVERITY_COLORS.items()
+}
+STYLE_COMM = {
+    "disabled": "background:#c9c9c9; color:#333; border-radius:6px;",
+    "unknown": "background:#eeeeee; color:#333; border-radius:6px;",
+    "ok": "background:#2d7ff9; color:#fff; border-radius:6px; font-weight:800;",
+    "ng": "background:#e53935; color:#fff; border-radius:6px; font-weight:800;",
+}
+STYLE_ACTIVE_BUTTON = {
+    True: "background:#e8ffe8; border:2px solid #2e7d32; font-weight:800;",
+    False: "background:#c9c9c9; border:2px solid #7a7a7a; font-weight:700;",
+}
+STYLE_PLAYBACK_STOPPED = "background:#e53935; color:#ffffff; border:1px solid #999; font-weight:900;"
+STYLE_CELL = "border: 1px solid #999;"
+STYLE_CELL_INACTIVE = "border: 1px solid #999; background-color: #c9c9c9; color: #7a7a7a;"
 
 
 @dataclass
@@ -109,6 +217,17 @@ class SignState:
     last_error: str = ""
     last_update: Optional[str] = None
     active_channel: Optional[str] = None
+    # 列ウィジェットのキー（"Sign01" -> "Signage01"）と列番号（"Sign01" -> 0）。毎回 replace しないよう読込時に決める
+    column_key: str = ""
+    pc_index: int = -1
+    # 通信確認（tcp445）で online を確定させた時刻（monotonic）。タイムアウトでは更新しない
+    online_checked_at: float = 0.0
+
+
+class CachedStatus(NamedTuple):
+    # pc_status.json の指紋 (st_mtime_ns, st_size) と解析済みの中身
+    fingerprint: Tuple[int, int]
+    payload: dict
 
 
 def load_json(path: Path, default):
@@ -121,8 +240,24 @@ def ensure_dir(path: Path) -> None:
 
 # --- robust IO helpers (for SMB/AV/WinError5) -------------------------------
 
+# SMB/AV 向け I/O リトライ回数（書込み・置換）。コピーは大きいファイルがあるので少し多め
+IO_RETRIES = 10
+COPY_RETRIES = 12
+
+
 def _sleep_backoff(i: int, cap: float = 0.5) -> None:
-    time_module.sleep(min(cap, 0.05 * (2 ** i)))
+    # 複数スレッドが同じ共有に同時リトライしてぶつからないよう、±25% の揺らぎを入れる
+    base = min(cap, 0.05 * (2 ** i))
+    time_module.sleep(base * (0.75 + 0.5 * random.random()))
+
+
+if os.name == "nt":
+    # 非表示起動用の STARTUPINFO は共通で使い回す（Popen 側でコピーされるので共有して問題ない）
+    _HIDDEN_STARTUPINFO = subprocess.STARTUPINFO()
+    _HIDDEN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _HIDDEN_STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+else:
+    _HIDDEN_STARTUPINFO = None
 
 
 def run_hidden(*args, **kwargs) -> subprocess.CompletedProcess:
@@ -135,19 +270,17 @@ def run_hidden(*args, **kwargs) -> subprocess.CompletedProcess:
         kwargs["creationflags"] = creationflags | subprocess.CREATE_NO_WINDOW
         startupinfo = kwargs.get("startupinfo")
         if startupinfo is None:
-            startupinfo = subprocess.STARTUPINFO()
-            kwargs["startupinfo"] = startupinfo
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        startupinfo.wShowWindow = subprocess.SW_HIDE
+            kwargs["startupinfo"] = _HIDDEN_STARTUPINFO
+        else:
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
     return subprocess.run(*args, **kwargs)
 
 
-def is_reachable(ip: str) -> bool:
-    if not ip:
-        return False
+def _ping_once(ip: str, timeout_ms: int = 300) -> bool:
     try:
         result = run_hidden(
-            ["ping", "-n", "1", "-w", "300", ip],
+            ["ping", "-n", "1", "-w", str(int(timeout_ms)), ip],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             timeout=1,
@@ -158,7 +291,144 @@ def is_reachable(ip: str) -> bool:
         return False
 
 
-def safe_replace(tmp_path: Path, dst_path: Path, *, retries: int = 10) -> None:
+# 共有スレッドプール（呼び出しごとに作らない）。用途別に分けて、ping の集中がファイル転送を詰まらせないようにする
+# - _PING_EXECUTOR: icmplib が無い環境で ping.exe を並列に投げる
+# - _IO_EXECUTOR: sync_mirror_dir / LOG回収のファイルコピー（全サイン合計の同時転送数の上限にもなる）
+_PING_EXECUTOR = ThreadPoolExecutor(max_workers=N_SIGNAGE, thread_name_prefix="tsuyama-ping")
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="tsuyama-io")
+atexit.register(_PING_EXECUTOR.shutdown, wait=False)
+atexit.register(_IO_EXECUTOR.shutdown, wait=False)
+
+
+def multi_reachable(ips: List[str], timeout_ms: int = 300) -> Dict[str, bool]:
+    """
+    複数台の ping をまとめて投げる。所要時間は最も遅い 1 台分になる。
+    icmplib があればプロセスを起動せず 1 スレッドで送受信し、無ければ ping.exe を並列実行する。
+    """
+    targets = list(dict.fromkeys(ip for ip in ips if ip))
+    result: Dict[str, bool] = {ip: False for ip in ips}
+    if not targets:
+        return result
+    if icmplib is not None:
+        try:
+            hosts = icmplib.multiping(
+                targets,
+                count=1,
+                interval=0,
+                timeout=timeout_ms / 1000.0,
+                privileged=False,
+            )
+            for ip, host in zip(targets, hosts):
+                result[ip] = bool(host.is_alive)
+            return result
+        except Exception:
+            # 権限や環境依存で使えない場合は ping.exe に戻す
+            pass
+    for ip, ok in zip(targets, _PING_EXECUTOR.map(lambda x: _ping_once(x, timeout_ms), targets)):
+        result[ip] = ok
+    return result
+
+
+# TCP 到達確認用の asyncio ループ（専用スレッド 1 本で全台分のソケットを多重化する）
+_ASYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="tsuyama-async", daemon=True).start()
+            atexit.register(loop.call_soon_threadsafe, loop.stop)
+            _ASYNC_LOOP = loop
+        return _ASYNC_LOOP
+
+
+async def _tcp_probe_async(ip: str, port: int, timeout: float) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+# 非ブロッキング connect が「接続処理中」を返すときのエラー番号（Windows は WSAEWOULDBLOCK）
+_CONNECT_IN_PROGRESS = frozenset(
+    code
+    for code in (
+        errno.EINPROGRESS,
+        errno.EWOULDBLOCK,
+        errno.EALREADY,
+        getattr(errno, "WSAEWOULDBLOCK", None),
+    )
+    if code is not None
+)
+
+
+def tcp_probe(ip: str, port: int, timeout: float = 1.0) -> bool:
+    """
+    数値 IPv4 なら名前解決を通さず、非ブロッキング connect + select で timeout ちょうどまでしか待たない。
+    """
+    try:
+        socket.inet_aton(ip)
+    except (OSError, TypeError):
+        # ホスト名などは従来どおり create_connection に任せる
+        try:
+            with socket.create_connection((ip, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setblocking(False)
+        err = sock.connect_ex((ip, port))
+        if err == 0:
+            return True
+        if err not in _CONNECT_IN_PROGRESS:
+            return False
+        # Windows は接続失敗を例外集合で通知するので両方を見る
+        _, writable, failed = select.select([], [sock], [sock], timeout)
+        if not writable and not failed:
+            return False
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def multi_tcp_probe(ips: List[str], port: int, timeout: float = 0.2) -> Dict[str, bool]:
+    """
+    複数台の TCP 接続確認をまとめて行う。所要時間は最も遅い 1 台分（最大 timeout）になる。
+    """
+    targets = list(dict.fromkeys(ip for ip in ips if ip))
+    result: Dict[str, bool] = {ip: False for ip in ips}
+    if not targets:
+        return result
+
+    async def probe_all() -> List[bool]:
+        return await asyncio.gather(*(_tcp_probe_async(ip, port, timeout) for ip in targets))
+
+    future = asyncio.run_coroutine_threadsafe(probe_all(), _get_async_loop())
+    try:
+        oks = future.result(timeout=timeout + 1.0)
+    except Exception:
+        future.cancel()
+        return result
+    for ip, ok in zip(targets, oks):
+        result[ip] = ok
+    return result
+
+
+def is_reachable(ip: str) -> bool:
+    if not ip:
+        return False
+    return multi_reachable([ip])[ip]
+
+
+def safe_replace(tmp_path: Path, dst_path: Path, *, retries: int = IO_RETRIES) -> None:
     """
     Windows/SMB/AV環境では、読み取り側が一瞬掴むだけで os.replace / Path.replace が WinError 5 で失敗することがある。
     短いリトライで吸収する。
@@ -190,8 +460,7 @@ def safe_read_json(path: Path, default, *, retries: int = 3):
     last_exc = None
     for i in range(max(1, int(retries))):
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                return json.load(fh)
+            return loads_json(path.read_bytes())
         except (FileNotFoundError,):
             return default
         except (json.JSONDecodeError, PermissionError, OSError) as exc:
@@ -201,7 +470,7 @@ def safe_read_json(path: Path, default, *, retries: int = 3):
         except Exception as exc:
             last_exc = exc
             break
-    logging.warning("safe_read_json failed: %s (%s)", path, last_exc)
+    logger.warning("safe_read_json failed: %s (%s)", path, last_exc)
     return default
 
 
@@ -224,38 +493,143 @@ def is_same_file(master: Path, remote: Path, compare_ctime: bool = True) -> bool
     return (m_mtime == r_mtime) and (m_size == r_size)
 
 
-def copy_file_atomic(src: Path, dst: Path) -> None:
-    ensure_dir(dst.parent)
-    tmp = dst.with_suffix(dst.suffix + ".tmp")
-    if tmp.exists():
+# 同じファイルへの書込みを直列化する（.tmp / .bak 名の衝突防止）。別パスはお互いを待たない
+_PATH_LOCKS: Dict[str, threading.RLock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _get_path_lock(path: Path) -> threading.RLock:
+    key = os.path.normcase(str(path))
+    with _PATH_LOCKS_GUARD:
+        lock = _PATH_LOCKS.get(key)
+        if lock is None:
+            lock = _PATH_LOCKS[key] = threading.RLock()
+        return lock
+
+
+COPY_FILE_NO_BUFFERING = 0x00001000
+# これ以上のファイル（動画）は CopyFileExW でキャッシュを通さずにコピーする
+UNBUFFERED_COPY_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _win_copyfileex(src: Path, dst: Path) -> bool:
+    """
+    Windows の CopyFileExW(COPY_FILE_NO_BUFFERING) でコピーする。
+    カーネル内で転送され、タイムスタンプ・属性も CopyFile 側で引き継がれる。失敗時は False。
+    """
+    if os.name != "nt":
+        return False
+    try:
+        ok = ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, COPY_FILE_NO_BUFFERING)
+    except Exception:
+        return False
+    return bool(ok)
+
+
+def copy_file_atomic(
+    src: Path,
+    dst: Path,
+    dst_exists: Optional[bool] = None,
+    keep_backup: bool = False,
+    src_size: Optional[int] = None,
+) -> None:
+    """
+    tmp へコピーしてから 1 回の置換で dst を差し替える（置換自体が原子的なので .bak は必須ではない）。
+    keep_backup=True の時だけ旧 dst を .bak に退避する。
+    dst_exists: 呼び出し側が走査済みなら渡す（SMB 越しの stat を省く）。None なら自分で確認する。
+    src_size: 同上（大きいファイルかどうかの判定に使う）。
+    """
+    with _get_path_lock(dst):
+        ensure_dir(dst.parent)
+        tmp = dst.with_suffix(dst.suffix + ".tmp")
         try:
             tmp.unlink()
         except Exception:
             pass
-    shutil.copy2(src, tmp)
-    bak = dst.with_suffix(dst.suffix + ".bak")
-    try:
-        if dst.exists():
-            try:
-                if bak.exists():
-                    bak.unlink()
-            except Exception:
-                pass
-            try:
-                dst.replace(bak)
-            except Exception:
-                pass
-    except Exception:
-        pass
-    safe_replace(tmp, dst, retries=12)
+        if src_size is None:
+            src_size = src.stat().st_size
+        if not (src_size >= UNBUFFERED_COPY_MIN_BYTES and _win_copyfileex(src, tmp)):
+            shutil.copy2(src, tmp)
+        if not keep_backup:
+            safe_replace(tmp, dst, retries=COPY_RETRIES)
+            return
+        bak = dst.with_suffix(dst.suffix + ".bak")
+        if dst_exists is None:
+            dst_exists = dst.exists()
+        try:
+            if dst_exists:
+                try:
+                    if bak.exists():
+                        bak.unlink()
+                except Exception:
+                    pass
+                try:
+                    dst.replace(bak)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        safe_replace(tmp, dst, retries=COPY_RETRIES)
 
 
-SYNC_EXTS = {".mp4", ".mov", ".jpg", ".jpeg", ".png", ".webp"}
+SYNC_EXTS = frozenset({".mp4", ".mov", ".jpg", ".jpeg", ".png", ".webp"})
 SYNC_SAMPLE_SUFFIX = "_sample.mp4"
 
 
-def _is_sample_video(name: str) -> bool:
-    return name.lower().endswith(SYNC_SAMPLE_SUFFIX)
+FAST_HASH_CHUNK = 256 * 1024
+FULL_HASH_CHUNK = 4 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1024)
+def _fast_hash_cached(path_str: str, mtime_ms: int, size: int) -> bytes:
+    h = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    h.update(size.to_bytes(8, "little"))
+    with open(path_str, "rb") as fh:
+        h.update(fh.read(FAST_HASH_CHUNK))
+        if size > FAST_HASH_CHUNK * 2:
+            fh.seek(size - FAST_HASH_CHUNK)
+        h.update(fh.read(FAST_HASH_CHUNK))
+    return h.digest()
+
+
+def fast_hash(path: Path, stat_tuple: Tuple[int, int]) -> bytes:
+    """
+    先頭と末尾 256KB + サイズだけの簡易指紋（xxhash があれば xxh3、無ければ blake2b）。
+    stat_tuple は (size, mtime_ms)。同じ (path, mtime, size) の再計算はキャッシュで省く。
+    """
+    size, mtime_ms = stat_tuple
+    return _fast_hash_cached(str(path), mtime_ms, size)
+
+
+def full_hash(path: Path) -> bytes:
+    """ファイル全体の指紋。fast_hash が一致した時の確認用（中間だけ差し替わった動画を見逃さない）。"""
+    h = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(FULL_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _scan_sync_files(directory: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    同期対象ファイルの {name: (size, mtime_ms)} を scandir 1 回で集める。
+    （DirEntry のキャッシュを使うので、Windows ではファイルごとの stat が発生しない）
+    """
+    files: Dict[str, Tuple[int, int]] = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            # 小文字化はファイル名ごとに 1 回だけ
+            lower = name.lower()
+            if os.path.splitext(lower)[1] not in SYNC_EXTS:
+                continue
+            if lower.endswith(SYNC_SAMPLE_SUFFIX):
+                continue
+            st = entry.stat()
+            files[name] = (int(st.st_size), int(st.st_mtime_ns // 1_000_000))
+    return files
 
 
 def sync_mirror_dir(
@@ -264,65 +638,102 @@ def sync_mirror_dir(
     logger=None,
     dry_run: bool = False,
     compare_ctime: bool = True,
+    copy_workers: int = 4,
+    hash_check: bool = False,
 ) -> Dict[str, int]:
     result = {"copied": 0, "updated": 0, "deleted": 0, "skipped": 0, "errors": 0}
     ensure_dir(remote_dir)
 
-    master_files: Dict[str, Tuple[int, int]] = {}
-    for entry in master_dir.iterdir():
-        if not entry.is_file():
-            continue
-        if entry.suffix.lower() not in SYNC_EXTS:
-            continue
-        if _is_sample_video(entry.name):
-            continue
-        st = entry.stat()
-        master_files[entry.name] = (int(st.st_size), int(st.st_mtime * 1000))
-
-    remote_files: Dict[str, Tuple[int, int]] = {}
-    for entry in remote_dir.iterdir():
-        if not entry.is_file():
-            continue
-        if entry.suffix.lower() not in SYNC_EXTS:
-            continue
-        if _is_sample_video(entry.name):
-            continue
-        st = entry.stat()
-        remote_files[entry.name] = (int(st.st_size), int(st.st_mtime * 1000))
+    master_files = _scan_sync_files(master_dir)
+    remote_files = _scan_sync_files(remote_dir)
 
-    to_copy: List[str] = []
+    # まず I/O なしで決まるもの（新規・サイズ違い）を小さい順に並べ、すぐ転送を始める。
+    # mtime だけ違うものは指紋の読み取りが要るので、転送と並行して判定する。
+    copy_heap: List[Tuple[int, str]] = []
+    hash_candidates: List[str] = []
     for name, (msize, mtime_ms) in master_files.items():
         remote_meta = remote_files.get(name)
         # 大容量動画での差分同期精度を上げるため、サイズ+mtime が一致した時だけ SKIP する。
-        if remote_meta is None:
-            to_copy.append(name)
+        # （hash_check 有効時のみ、mtime 違いも中身が全く同じなら SKIP-HASH にする）
+        if remote_meta is None or remote_meta[0] != msize:
+            heapq.heappush(copy_heap, (msize, name))
+        elif remote_meta[1] != mtime_ms:
+            hash_candidates.append(name)
         else:
-            rsize, rmtime_ms = remote_meta
-            if rsize != msize or rmtime_ms != mtime_ms:
-                to_copy.append(name)
-            else:
-                if logger:
-                    logger(f"[SKIP] {name}")
-                result["skipped"] += 1
+            if logger:
+                logger(f"[SKIP] {name}")
+            result["skipped"] += 1
 
     to_delete = [name for name in remote_files.keys() if name not in master_files]
 
-    for name in sorted(to_copy):
-        src = master_dir / name
-        dst = remote_dir / name
+    def copy_one(name: str) -> None:
+        if logger:
+            logger(f"[COPY] {name}")
+        if not dry_run:
+            copy_file_atomic(
+                master_dir / name,
+                remote_dir / name,
+                dst_exists=name in remote_files,
+                src_size=master_files[name][0],
+            )
+
+    def content_same(name: str) -> bool:
+        # サイズ一致で mtime だけ違う場合（AV スキャン等）は中身で判断し、大容量動画の再転送を避ける。
+        # 先頭/末尾の簡易指紋で違いが分かればすぐコピー、一致したら全体を読んで確かめる
+        if not hash_check:
+            return False
         try:
-            if logger:
-                logger(f"[COPY] {name}")
-            if not dry_run:
-                copy_file_atomic(src, dst)
-            if name in remote_files:
-                result["updated"] += 1
+            if fast_hash(master_dir / name, master_files[name]) != fast_hash(remote_dir / name, remote_files[name]):
+                return False
+            return full_hash(master_dir / name) == full_hash(remote_dir / name)
+        except OSError:
+            return False
+
+    def adopt_master_mtime(name: str) -> None:
+        # 中身が同じと確認できたら remote の mtime を master に揃え、次回からは通常の SKIP で済ませる
+        if dry_run:
+            return
+        mtime_ns = master_files[name][1] * 1_000_000
+        try:
+            os.utime(remote_dir / name, ns=(mtime_ns, mtime_ns))
+        except OSError:
+            pass
+
+    # SMB の書込みは 1 本では回線を使い切れないので、数本並列で流す（削除はメタデータ操作なので順次）
+    # 共有プールを使い、この呼び出しの同時転送数は copy_workers で抑える
+    if copy_heap or hash_candidates:
+        slots = threading.BoundedSemaphore(max(1, int(copy_workers)))
+        future_to_name = {}
+
+        def submit_copy(name: str) -> None:
+            slots.acquire()
+            future = _IO_EXECUTOR.submit(copy_one, name)
+            future.add_done_callback(lambda _f: slots.release())
+            future_to_name[future] = name
+
+        while copy_heap:
+            _, name = heapq.heappop(copy_heap)
+            submit_copy(name)
+        for name in sorted(hash_candidates, key=lambda n: master_files[n][0]):
+            if content_same(name):
+                if logger:
+                    logger(f"[SKIP-HASH] {name}")
+                adopt_master_mtime(name)
+                result["skipped"] += 1
             else:
-                result["copied"] += 1
-        except Exception as exc:
-            if logger:
-                logger(f"[ERR] copy {name}: {repr(exc)}")
-            result["errors"] += 1
+                submit_copy(name)
+        for future in as_completed(future_to_name):
+            name = future_to_name[future]
+            try:
+                future.result()
+                if name in remote_files:
+                    result["updated"] += 1
+                else:
+                    result["copied"] += 1
+            except Exception as exc:
+                if logger:
+                    logger(f"[ERR] copy {name}: {repr(exc)}")
+                result["errors"] += 1
 
     for name in sorted(to_delete):
         try:
@@ -338,59 +749,118 @@ def sync_mirror_dir(
 
     return result
 
-def write_json_atomic(path: Path, payload: dict) -> None:
-    ensure_dir(path.parent)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    bak_path = path.with_suffix(path.suffix + ".bak")
-    if path.exists():
+def _backup_by_link(path: Path, bak_path: Path) -> None:
+    """
+    直後に tmp からの置換で path が別実体になる前提で、現行ファイルを .bak にハードリンクする。
+    （データコピーなし。リンク不可のファイルシステムでは従来どおり copy2）
+    """
+    try:
+        bak_path.unlink()
+    except OSError:
+        pass
+    try:
+        os.link(path, bak_path)
+    except FileNotFoundError:
+        return
+    except OSError:
         shutil.copy2(path, bak_path)
-    with tmp_path.open("w", encoding="utf-8", newline="\n") as fh:
-        json.dump(payload, fh, ensure_ascii=False, indent=2)
-        fh.write("\n")
-    safe_replace(tmp_path, path, retries=10)
 
 
-def write_json_atomic_remote(path: Path, payload: dict) -> None:
+# active.json は形が固定なので、値だけエンコードしてテンプレートに差し込む
+# （json.dump(indent=2) + "\n" と同一のバイト列になる）
+_ACTIVE_JSON_TMPL = b'{\n  "active_channel": %s\n}\n'
+
+
+def _dump_json_bytes(payload: dict) -> bytes:
+    if len(payload) == 1 and "active_channel" in payload:
+        value = payload["active_channel"]
+        if value is None or type(value) is str:
+            return _ACTIVE_JSON_TMPL % dumps_json(value)
+    return dumps_json(payload) + b"\n"
+
+
+def write_json_atomic(path: Path, payload: dict, keep_backup: bool = False) -> None:
+    """
+    keep_backup=True は設定ファイル等、人手で戻す可能性があるものだけに使う。
+    active.json のように毎回再計算できるものは .bak を作らない。
+    """
+    with _get_path_lock(path):
+        ensure_dir(path.parent)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        if keep_backup:
+            _backup_by_link(path, path.with_suffix(path.suffix + ".bak"))
+        with tmp_path.open("wb") as fh:
+            fh.write(_dump_json_bytes(payload))
+        safe_replace(tmp_path, path, retries=IO_RETRIES)
+
+
+# UNC への fsync は SMB2 FLUSH の往復になり重いので、既定では行わない
+WRITE_JSON_FSYNC_REMOTE = False
+
+
+def write_json_atomic_remote(path: Path, payload: dict, fsync: Optional[bool] = None) -> None:
     """
     UNC(ネットワーク共有)向け: 親ディレクトリ作成はしない。
     （リモート側のフォルダ構成は前提として存在する）
+    fsync: None なら WRITE_JSON_FSYNC_REMOTE に従う。書込み後の読み戻し確認は fsync の有無に関係なく行う。
     """
-    last_exc = None
-    for i in range(10):
-        try:
-            bak_path = path.with_suffix(path.suffix + ".bak")
+    if fsync is None:
+        fsync = WRITE_JSON_FSYNC_REMOTE
+    with _get_path_lock(path):
+        last_exc = None
+        for i in range(IO_RETRIES):
             try:
-                if path.exists():
-                    shutil.copy2(path, bak_path)
-            except Exception:
-                pass
-            with path.open("w", encoding="utf-8", newline="\n") as fh:
-                json.dump(payload, fh, ensure_ascii=False, indent=2)
-                fh.write("\n")
-                fh.flush()
+                bak_path = path.with_suffix(path.suffix + ".bak")
                 try:
-                    os.fsync(fh.fileno())
-                except OSError:
+                    if path.exists():
+                        shutil.copy2(path, bak_path)
+                except Exception:
                     pass
-            verify = safe_read_json(path, default=None, retries=3)
-            if not isinstance(verify, dict):
-                raise RuntimeError("verify read failed")
-            if verify.get("active_channel") != payload.get("active_channel"):
-                raise RuntimeError(
-                    f"verify mismatch: expected={payload.get('active_channel')} actual={verify.get('active_channel')}"
-                )
-            return
-        except (PermissionError, OSError, RuntimeError) as exc:
-            last_exc = exc
-            _sleep_backoff(i)
-    raise RuntimeError(f"write_json_atomic_remote failed: {path} ({last_exc})")
+                data = _dump_json_bytes(payload)
+                with path.open("wb") as fh:
+                    fh.write(data)
+                    fh.flush()
+                    if fsync:
+                        try:
+                            os.fsync(fh.fileno())
+                        except OSError:
+                            pass
+                verify = safe_read_json(path, default=None, retries=3)
+                if not isinstance(verify, dict):
+                    raise RuntimeError("verify read failed")
+                if verify.get("active_channel") != payload.get("active_channel"):
+                    raise RuntimeError(
+                        f"verify mismatch: expected={payload.get('active_channel')} actual={verify.get('active_channel')}"
+                    )
+                return
+            except (PermissionError, OSError, RuntimeError) as exc:
+                last_exc = exc
+                _sleep_backoff(i)
+        raise RuntimeError(f"write_json_atomic_remote failed: {path} ({last_exc})")
+
+
+_HHMM_RE = re.compile(r"([0-9]{1,2}):([0-9]{1,2})")
 
 
+@functools.lru_cache(maxsize=512)
 def parse_time(value: str) -> time:
-    return datetime.strptime(value, "%H:%M").time()
+    """
+    "HH:MM" を time に変換する（strptime("%H:%M") 相当）。
+    ルールの時刻文字列は種類が少ないので結果をキャッシュする。
+    """
+    match = _HHMM_RE.fullmatch(value)
+    if not match:
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    h = int(match.group(1))
+    m = int(match.group(2))
+    if not (0 <= h <= 23 and 0 <= m <= 59):
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    return time(h, m)
 
 
 def normalize_hhmm(text: str) -> str:
+    # 入力欄用（保存時に 1 回呼ばれるだけなので速さより寛容さを優先する）。
+    # 各部は int() に任せるので "8 : 5" や "+8:5"、全角数字もこれまでどおり受け付ける
     s = (text or "").strip()
     s = s.replace("：", ":")
     if ":" in s:
@@ -457,7 +927,7 @@ def default_sign_config(sign_name: str) -> dict:
     }
 
 
-def _sanitize_ai_choice(value: Optional[str], choices: List[str]) -> str:
+def _sanitize_ai_choice(value: Optional[str], choices: Tuple[str, ...]) -> str:
     if value == "same_as_normal":
         return "same_as_normal"
     if value in choices:
@@ -472,7 +942,7 @@ def sanitize_sign_config(config: dict, sign_name: str) -> dict:
     merged.setdefault("sleep_rules", base["sleep_rules"])
     merged.setdefault("timer_rules", base["timer_rules"])
     normal_channel = merged.get("normal_channel", base["normal_channel"])
-    if normal_channel not in NORMAL_CHOICES:
+    if normal_channel not in NORMAL_CHOICE_SET:
         normal_channel = "ch05"
     merged["normal_channel"] = normal_channel
     ai_channels = merged.get("ai_channels", {})
@@ -488,7 +958,7 @@ def sanitize_sign_config(config: dict, sign_name: str) -> dict:
         if not isinstance(rule, dict):
             continue
         channel = rule.get("channel", "ch05")
-        if channel not in TIMER_CHOICES:
+        if channel not in TIMER_CHOICE_SET:
             channel = "ch05"
         sanitized_timer_rules.append(
             {
@@ -527,12 +997,7 @@ def extract_congestion_level(ai_status: dict, default: int = 1) -> int:
     return max(1, min(4, level))
 
 
-def compute_active_channel(
-    sign_config: dict,
-    ai_status: dict,
-    now: datetime,
-) -> str:
-    current_time = now.time()
+def _evaluate_active_channel(sign_config: dict, level: int, current_time: time) -> str:
     for window in sign_config.get("sleep_rules", []):
         try:
             start = parse_time(window["start"])
@@ -542,14 +1007,13 @@ def compute_active_channel(
         except Exception:
             continue
 
-    level = extract_congestion_level(ai_status, default=1)
     if level >= 2:
         ai_channels = sign_config.get("ai_channels", {})
         key = f"level{level}"
         ai_choice = ai_channels.get(key)
         if ai_choice == "same_as_normal":
             return sign_config.get("normal_channel", "ch05")
-        if ai_choice in CHANNELS:
+        if ai_choice in CHANNEL_SET:
             return ai_choice
 
     matched_channel = None
@@ -568,6 +1032,76 @@ def compute_active_channel(
     return sign_config.get("normal_channel", "ch05")
 
 
+def next_rule_boundary(sign_configs: List[dict], now: datetime) -> datetime:
+    """
+    now より後で、いずれかのサインの休眠/タイマー設定の開始・終了時刻にあたる最初の時刻（分単位）。
+    日付が変わる 0:00 も切替点として扱う。
+    """
+    boundaries = {0}
+    for config in sign_configs:
+        for rule in list(config.get("sleep_rules", [])) + list(config.get("timer_rules", [])):
+            for key in ("start", "end"):
+                try:
+                    value = parse_time(rule[key])
+                except Exception:
+                    continue
+                boundaries.add(value.hour * 60 + value.minute)
+    now_minute = now.hour * 60 + now.minute
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    later = [minute for minute in boundaries if minute > now_minute]
+    if later:
+        return day_start + timedelta(minutes=min(later))
+    return day_start + timedelta(days=1, minutes=min(boundaries))
+
+
+def _active_minute_key(now: datetime) -> Tuple[int, bool]:
+    """
+    ルールは分単位なので、同じ分の中なら結果は変わらない。
+    ただし終了時刻ちょうど（秒・マイクロ秒が 0）だけは範囲内と判定されるため区別する。
+    """
+    return now.hour * 60 + now.minute, not (now.second or now.microsecond)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_active_channel_cached(config_key: str, level: int, minute_key: Tuple[int, bool]) -> str:
+    minute, on_boundary = minute_key
+    current_time = time(minute // 60, minute % 60, 0 if on_boundary else 30)
+    return _evaluate_active_channel(json.loads(config_key), level, current_time)
+
+
+def config_cache_key(sign_config: dict) -> str:
+    return json.dumps(sign_config, ensure_ascii=False, sort_keys=True)
+
+
+# サイン別の直近結果: sign_name -> (minute_key, level, config_key, channel)
+_ACTIVE_CHANNEL_CACHE: Dict[str, Tuple[Tuple[int, bool], int, str, str]] = {}
+
+
+def compute_active_channel(
+    sign_config: dict,
+    ai_status: dict,
+    now: datetime,
+    config_key: Optional[str] = None,
+    sign_name: Optional[str] = None,
+) -> str:
+    """
+    config_key（config_cache_key の値）を渡すと (設定, LEVEL, 分) 単位で結果をキャッシュする。
+    sign_name も渡すと、同じ分・同じ LEVEL・同じ設定の間はサイン別の直近結果をそのまま返す。
+    """
+    level = extract_congestion_level(ai_status, default=1)
+    if config_key is None:
+        return _evaluate_active_channel(sign_config, level, now.time())
+    minute_key = _active_minute_key(now)
+    if sign_name is not None:
+        cached = _ACTIVE_CHANNEL_CACHE.get(sign_name)
+        if cached and cached[0] == minute_key and cached[1] == level and cached[2] == config_key:
+            return cached[3]
+    channel = _compute_active_channel_cached(config_key, level, minute_key)
+    if sign_name is not None:
+        _ACTIVE_CHANNEL_CACHE[sign_name] = (minute_key, level, config_key, channel)
+    return channel
+
+
 if WATCHDOG_AVAILABLE:
     class AiStatusHandler(FileSystemEventHandler):
         def __init__(self, callback):
@@ -579,6 +1113,161 @@ if WATCHDOG_AVAILABLE:
                 self._callback()
 
 
+# 共有スタイルシート。ボタンは objectName のセレクタで当てる
+_BUTTON_3D_QSS = """
+QPushButton#btn3d {
+  padding: 6px 10px;
+  border: 1px solid #8a8a8a;
+  border-radius: 6px;
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 #ffffff, stop:1 #e6e6e6);
+}
+QPushButton#btn3d:hover {
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 #ffffff, stop:1 #f0f0f0);
+}
+QPushButton#btn3d:pressed {
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 #dcdcdc, stop:1 #f6f6f6);
+  border: 1px solid #6f6f6f;
+}
+QPushButton#btn3d:disabled {
+  background: #d6d6d6;
+  color: #777;
+}
+"""
+_BUTTON_EMERGENCY_QSS = """
+QPushButton#btnEmergency {
+  padding: 6px 10px;
+  border: 1px solid #8a8a8a;
+  border-radius: 8px;
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #e6e6e6);
+}
+QPushButton#btnEmergency:checked {
+  background: #e53935;
+  color: #fff;
+  font-weight: 900;
+  font-size: 14px;
+  border: 1px solid #7a1f1f;
+}
+QPushButton#btnEmergency:checked:disabled {
+  background: #e53935;
+  color: #fff;
+}
+QPushButton#btnEmergency:disabled {
+  background: #d6d6d6;
+  color: #777;
+}
+"""
+CONTROLLER_STYLE_SHEET = _BUTTON_3D_QSS + _BUTTON_EMERGENCY_QSS
+# 列のボタン用。非アクティブ時の灰色（* 指定）は列に付くので、ボタンの指定も列側に置いて優先させる
+_COLUMN_BUTTON_QSS = """
+QPushButton#columnButton {
+  padding: 4px 6px;
+  border: 1px solid #8a8a8a;
+  border-radius: 6px;
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 #ffffff, stop:1 #e6e6e6);
+}
+QPushButton#columnButton:pressed {
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 #dcdcdc, stop:1 #f6f6f6);
+}
+"""
+COLUMN_STYLE_SHEET = _COLUMN_BUTTON_QSS
+COLUMN_STYLE_SHEET_INACTIVE = "* { background-color: #c9c9c9; color: #7a7a7a; }\n" + _COLUMN_BUTTON_QSS
+
+
+def apply_style_sheet(widget: QtWidgets.QWidget, sheet: str) -> None:
+    # setStyleSheet は同じ内容でも再 polish が走るため、前回と同じなら何もしない
+    if widget.property("_applied_style") == sheet:
+        return
+    widget.setProperty("_applied_style", sheet)
+    widget.setStyleSheet(sheet)
+
+
+def set_text_if_changed(label: QtWidgets.QLabel, text: str) -> None:
+    if label.text() != text:
+        label.setText(text)
+
+
+@functools.lru_cache(maxsize=N_SIGNAGE * 2)
+def format_pc_timestamp(value: str) -> str:
+    # 多くの tick では pc_status.json の timestamp が前回と同じなので、解析結果を使い回す
+    try:
+        parsed = datetime.fromisoformat(value)
+    except Exception:
+        return "不明"
+    return parsed.strftime("%m/%d %H:%M:%S")
+
+
+def copy_log_entry(entry: os.DirEntry, dst: Path) -> None:
+    """
+    LOG回収用。中身をコピーし、更新時刻は一覧取得時の stat 結果から写す（copy2 のように元ファイルを stat し直さない）。
+    """
+    shutil.copyfile(entry.path, dst)
+    st = entry.stat()
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def preview_poster_path(sample: Path, mtime_ns: int) -> Path:
+    # 動画を差し替えたら（mtime が変われば）別名になるので、古い静止画を誤って使わない
+    digest = hashlib.blake2b(f"{sample}:{mtime_ns}".encode("utf-8"), digest_size=12).hexdigest()
+    return PREVIEW_POSTER_DIR / f"{sample.stem}.{digest}.jpg"
+
+
+def save_preview_poster(image: QtGui.QImage, poster: Path) -> None:
+    # 作れなくてもプレビュー自体は出せるので、失敗は握りつぶす（次回また作る）
+    try:
+        ensure_dir(poster.parent)
+        tmp = poster.with_suffix(".tmp.jpg")
+        if image.save(str(tmp), "JPG", PREVIEW_POSTER_JPEG_QUALITY):
+            os.replace(tmp, poster)
+    except OSError as exc:
+        logger.debug("preview poster save failed (%s): %s", poster, exc)
+
+
+# (UNIX 秒, 整形済み文字列)。同じ秒の間は使い回す
+_NOW_STAMP: Tuple[int, str] = (0, "")
+
+
+def now_stamp() -> str:
+    """
+    現在時刻の "%Y-%m-%d %H:%M:%S" 文字列。一括処理で台数分 strftime しないよう秒単位で使い回す。
+    """
+    global _NOW_STAMP
+    sec = int(time_module.time())
+    cached = _NOW_STAMP
+    if cached[0] != sec:
+        cached = (sec, datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S"))
+        _NOW_STAMP = cached
+    return cached[1]
+
+
+@functools.lru_cache(maxsize=256)
+def _worker_arity_cached(worker_fn) -> Tuple[bool, bool]:
+    try:
+        sig = inspect.signature(worker_fn)
+    except (TypeError, ValueError):
+        return False, False
+    params = list(sig.parameters.values())
+    if any(p.kind == p.VAR_POSITIONAL for p in params):
+        return True, True
+    return len(params) >= 2, len(params) >= 3
+
+
+def worker_arity(worker_fn) -> Tuple[bool, bool]:
+    """
+    run_exclusive_task のワーカーが (op_id, cancel_event) を受け取れるか。
+    束縛メソッドは同じ self・関数なら等価なので、毎回の inspect.signature を省ける。
+    """
+    try:
+        return _worker_arity_cached(worker_fn)
+    except TypeError:
+        # ハッシュできない呼び出し可能オブジェクト
+        return _worker_arity_cached.__wrapped__(worker_fn)
+
+
 class TimeNormalizeDelegate(QtWidgets.QStyledItemDelegate):
     def __init__(self, table: QtWidgets.QTableWidget, parent=None):
         super().__init__(parent)
@@ -702,7 +1391,7 @@ class ConfigDialog(QtWidgets.QDialog):
     def _ai_choice_to_display(self, value: Optional[str]) -> str:
         return AI_SAME_AS_NORMAL_LABEL if value == "same_as_normal" else str(value or "")
 
-    def _set_ai_combo_value(self, combo: QtWidgets.QComboBox, value: Optional[str], choices: List[str]) -> None:
+    def _set_ai_combo_value(self, combo: QtWidgets.QComboBox, value: Optional[str], choices: Tuple[str, ...]) -> None:
         display_value = self._ai_choice_to_display(value)
         if display_value not in choices:
             display_value = AI_SAME_AS_NORMAL_LABEL
@@ -715,14 +1404,20 @@ class ConfigDialog(QtWidgets.QDialog):
         self.sleep_table.setItem(0, 1, QtWidgets.QTableWidgetItem(rule.get("end", "")))
 
     def _rebuild_timer_rows(self, rules: List[dict]) -> None:
-        while self.timer_table.rowCount() > 0:
-            self.timer_table.removeRow(0)
-        for rule in rules:
-            self.add_timer_rule(rule)
+        # 行ごとの removeRow / 再描画を避け、まとめて作り直す
+        self.timer_table.setUpdatesEnabled(False)
+        self.timer_table.blockSignals(True)
+        try:
+            self.timer_table.setRowCount(0)
+            for rule in rules:
+                self.add_timer_rule(rule)
+        finally:
+            self.timer_table.blockSignals(False)
+            self.timer_table.setUpdatesEnabled(True)
 
     def _reload_form_from_config(self) -> None:
         normal_value = self.config.get("normal_channel", "ch05")
-        if normal_value not in NORMAL_CHOICES:
+        if normal_value not in NORMAL_CHOICE_SET:
             normal_value = "ch05"
         self.normal_combo.setCurrentText(normal_value)
         ai_channels = self.config.get("ai_channels", {})
@@ -741,7 +1436,7 @@ class ConfigDialog(QtWidgets.QDialog):
         channel_combo = QtWidgets.QComboBox()
         channel_combo.addItems(TIMER_CHOICES)
         channel_value = rule.get("channel", TIMER_CHOICES[0])
-        if channel_value not in TIMER_CHOICES:
+        if channel_value not in TIMER_CHOICE_SET:
             channel_value = "ch05"
         channel_combo.setCurrentText(channel_value)
         self.timer_table.setCellWidget(row, 2, channel_combo)
@@ -765,13 +1460,7 @@ class ConfigDialog(QtWidgets.QDialog):
             return
 
         current_sign = self.sign_name
-        candidates = []
-        for state in self.controller_window.sign_states.values():
-            if not state.exists:
-                continue
-            if state.name == current_sign:
-                continue
-            candidates.append(state.name)
+        candidates = [name for name in self.controller_window._existing_sign_names if name != current_sign]
 
         if not candidates:
             QtWidgets.QMessageBox.information(self, "確認", "参照できる対象がありません")
@@ -904,13 +1593,30 @@ class TimerLegendWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(220)
+        # 内容はサイズだけで決まるので、描画結果を保持してリサイズ時のみ作り直す
+        self._cache: Optional[QtGui.QPixmap] = None
+
+    def resizeEvent(self, event):
+        self._cache = None
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        if self._cache is None or self._cache.devicePixelRatio() != dpr:
+            cache = QtGui.QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            cache.setDevicePixelRatio(dpr)
+            cache_painter = QtGui.QPainter(cache)
+            try:
+                self._render(cache_painter, self.width(), self.height())
+            finally:
+                cache_painter.end()
+            self._cache = cache
         painter = QtGui.QPainter(self)
-        painter.fillRect(self.rect(), QtGui.QColor("white"))
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render(self, painter: QtGui.QPainter, width: int, height: int) -> None:
+        painter.fillRect(0, 0, width, height, QtGui.QColor("white"))
         painter.setPen(QtGui.QPen(QtGui.QColor(80, 80, 80)))
-        height = self.height()
-        width = self.width()
         right_pad = 40
         label_text = "タイマー設定"
         painter.save()
@@ -928,14 +1634,17 @@ class TimerLegendWidget(QtWidgets.QWidget):
         painter.restore()
         tick_x2 = width - 2
         tick_x1 = width - 22
+        ticks = QtGui.QPainterPath()
         for hour in [0, 6, 12, 18, 23]:
             y = int(height * (hour * 60) / (24 * 60))
-            painter.drawLine(tick_x1, y, tick_x2, y)
+            ticks.moveTo(tick_x1, y)
+            ticks.lineTo(tick_x2, y)
             painter.drawText(
                 QtCore.QRect(0, y - 8, width - right_pad, 16),
                 QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter,
                 f"{hour:02d}:00",
             )
+        painter.drawPath(ticks)
 
         legend_item_height = 16
         legend_height = len(TIMER_CHANNEL_COLORS) * legend_item_height
@@ -952,73 +1661,107 @@ class TimerLegendWidget(QtWidgets.QWidget):
 class TimerBarWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._rules = []
-        self._sleep_rules = []
+        # 描画用に (開始分, 終了分, 色) へ変換済みの区間（日付またぎは 2 区間に分割済み）
+        self._rule_segments: List[Tuple[int, int, QtGui.QColor]] = []
+        self._sleep_segments: List[Tuple[int, int, QtGui.QColor]] = []
+        # 区間を作った元のルール（同じ内容で再設定されたら parse_time をやり直さない）
+        self._rules_source: Optional[List[dict]] = None
+        self._sleep_rules_source: Optional[List[dict]] = None
+        # 現在の高さでの (y, 高さ, ブラシ) 描画キャッシュ。ルール変更・リサイズで破棄
+        self._paint_cache: Optional[List[Tuple[int, int, QtGui.QBrush]]] = None
+        self._paint_cache_height = -1
         self._enabled = True
 
-    def set_rules(self, rules: List[dict]) -> None:
-        self._rules = rules
-        self.update()
-
-    def set_sleep_rules(self, rules: List[dict]) -> None:
-        self._sleep_rules = rules or []
-        self.update()
+    # 色ごとの QBrush（全列で共有。fillRect のたびに一時ブラシを作らない）
+    _brush_cache: Dict[int, QtGui.QBrush] = {}
 
-    def set_column_enabled(self, enabled: bool) -> None:
-        self._enabled = enabled
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        background = QtGui.QColor(245, 245, 245) if not self._enabled else QtGui.QColor("white")
-        painter.fillRect(self.rect(), background)
-        height = self.height()
-        width = self.width()
-        painter.setPen(QtGui.QPen(QtGui.QColor(220, 220, 220)))
-        for hour in range(0, 25, 2):
-            y = int(height * (hour * 60) / (24 * 60))
-            painter.drawLine(0, y, width, y)
+    @classmethod
+    def _brush_for(cls, color: QtGui.QColor) -> QtGui.QBrush:
+        key = color.rgba()
+        brush = cls._brush_cache.get(key)
+        if brush is None:
+            brush = cls._brush_cache[key] = QtGui.QBrush(color)
+        return brush
 
-        # 休眠帯（黒っぽいねずみ色）を背景として表示
-        sleep_color = QtGui.QColor(90, 90, 90)
-        sleep_color.setAlpha(140)
-        for rule in self._sleep_rules:
+    @staticmethod
+    def _build_segments(rules: List[dict], color_for) -> List[Tuple[int, int, QtGui.QColor]]:
+        segments: List[Tuple[int, int, QtGui.QColor]] = []
+        for rule in rules:
             try:
                 start = parse_time(rule["start"])
                 end = parse_time(rule["end"])
             except Exception:
                 continue
+            color = color_for(rule)
             start_minutes = start.hour * 60 + start.minute
             end_minutes = end.hour * 60 + end.minute
             if start_minutes == end_minutes:
                 continue
             if start_minutes < end_minutes:
-                self._paint_segment(painter, start_minutes, end_minutes, sleep_color, height, width)
+                segments.append((start_minutes, end_minutes, color))
             else:
-                self._paint_segment(painter, start_minutes, 24 * 60, sleep_color, height, width)
-                self._paint_segment(painter, 0, end_minutes, sleep_color, height, width)
+                segments.append((start_minutes, 24 * 60, color))
+                segments.append((0, end_minutes, color))
+        return segments
 
-        for rule in self._rules:
-            try:
-                start = parse_time(rule["start"])
-                end = parse_time(rule["end"])
-            except Exception:
-                continue
-            color = TIMER_CHANNEL_COLORS.get(rule.get("channel"), QtGui.QColor(200, 200, 200))
-            start_minutes = start.hour * 60 + start.minute
-            end_minutes = end.hour * 60 + end.minute
-            if start_minutes == end_minutes:
-                continue
-            if start_minutes < end_minutes:
-                self._paint_segment(painter, start_minutes, end_minutes, color, height, width)
-            else:
-                self._paint_segment(painter, start_minutes, 24 * 60, color, height, width)
-                self._paint_segment(painter, 0, end_minutes, color, height, width)
+    def set_rules(self, rules: List[dict]) -> None:
+        if rules == self._rules_source:
+            return
+        self._rules_source = [dict(rule) if isinstance(rule, dict) else rule for rule in rules]
+        default_color = QtGui.QColor(200, 200, 200)
+        self._rule_segments = self._build_segments(
+            rules,
+            lambda rule: TIMER_CHANNEL_COLORS.get(rule.get("channel"), default_color),
+        )
+        self._paint_cache = None
+        self.update()
+
+    def set_sleep_rules(self, rules: List[dict]) -> None:
+        # 休眠帯（黒っぽいねずみ色）を背景として表示
+        rules = rules or []
+        if rules == self._sleep_rules_source:
+            return
+        self._sleep_rules_source = [dict(rule) if isinstance(rule, dict) else rule for rule in rules]
+        sleep_color = QtGui.QColor(90, 90, 90)
+        sleep_color.setAlpha(140)
+        self._sleep_segments = self._build_segments(rules, lambda rule: sleep_color)
+        self._paint_cache = None
+        self.update()
+
+    def set_column_enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+        self.update()
+
+    def resizeEvent(self, event):
+        self._paint_cache = None
+        super().resizeEvent(event)
+
+    def _paint_rects(self, height: int) -> List[Tuple[int, int, QtGui.QBrush]]:
+        if self._paint_cache is None or self._paint_cache_height != height:
+            rects: List[Tuple[int, int, QtGui.QBrush]] = []
+            # 休眠帯を先に積んで、その上にルールを重ねる
+            for start_minutes, end_minutes, color in self._sleep_segments + self._rule_segments:
+                # 分・高さとも非負の整数なので整数除算で同じ値になる（浮動小数を通さない）
+                y1 = height * start_minutes // 1440
+                y2 = height * end_minutes // 1440
+                rects.append((y1, y2 - y1 if y2 > y1 else 1, self._brush_for(color)))
+            self._paint_cache = rects
+            self._paint_cache_height = height
+        return self._paint_cache
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        background = QtGui.QColor(245, 245, 245) if not self._enabled else QtGui.QColor("white")
+        painter.fillRect(self.rect(), background)
+        height = self.height()
+        width = self.width()
+        painter.setPen(QtGui.QPen(QtGui.QColor(220, 220, 220)))
+        for hour in range(0, 25, 2):
+            y = height * hour // 24
+            painter.drawLine(0, y, width, y)
 
-    def _paint_segment(self, painter, start_minutes, end_minutes, color, height, width):
-        y1 = int(height * start_minutes / (24 * 60))
-        y2 = int(height * end_minutes / (24 * 60))
-        painter.fillRect(0, y1, width, max(1, y2 - y1), color)
+        for y, dy, brush in self._paint_rects(height):
+            painter.fillRect(0, y, width, dy, brush)
 
 
 class SignageColumnWidget(QtWidgets.QWidget):
@@ -1031,6 +1774,8 @@ class SignageColumnWidget(QtWidgets.QWidget):
         super().__init__(parent)
         self.name = name
         self.sign_id = sign_id
+        # 子ウィジェットをまとめて組み立てる間は再描画要求を止める
+        self.setUpdatesEnabled(False)
         self.layout = QtWidgets.QVBoxLayout(self)
         self.layout.setContentsMargins(4, 2, 4, 2)
         self.layout.setSpacing(2)
@@ -1043,18 +1788,17 @@ class SignageColumnWidget(QtWidgets.QWidget):
         self.preview_label = QtWidgets.QLabel("サンプルなし")
         self.preview_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         preview_layout.addWidget(self.preview_label)
+        # 動画プレビューのプレイヤーは再生する時にだけ作り、止めたら破棄する（20 列分のデコーダを常駐させない）
         self.video_widget = None
         self.player = None
         self._current_sample: Optional[Path] = None
         self.sample_list: List[Path] = []
+        # 巡回再生するサンプルの QUrl（sample_list が変わったら作り直す）
+        self._url_cache: Dict[Path, QtCore.QUrl] = {}
         self.sample_index = 0
         self.current_channel: Optional[str] = None
-        if HAS_QTMULTIMEDIA:
-            self.video_widget = QtMultimediaWidgets.QVideoWidget()
-            preview_layout.addWidget(self.video_widget)
-            self.player = QtMultimedia.QMediaPlayer()
-            self.player.setVideoOutput(self.video_widget)
-            self.player.mediaStatusChanged.connect(self._handle_media_status)
+        # 静止画プレビューで表示したい QPixmapCache のキー（ワーカーで作った画像の届け先判定に使う）
+        self.preview_key: Optional[str] = None
         self.preview_stack = preview_layout
         self.setting_button = QtWidgets.QPushButton("変更")
         self.sleep_label = self._make_label("-")
@@ -1119,43 +1863,40 @@ class SignageColumnWidget(QtWidgets.QWidget):
         self._apply_3d_button_style(self.setting_button)
         self._apply_3d_button_style(self.btn_reboot)
         self._apply_3d_button_style(self.btn_shutdown)
+        apply_style_sheet(self, COLUMN_STYLE_SHEET)
 
-        self.setting_button.clicked.connect(
-            lambda: self.clicked_config.emit(self.sign_id)
-        )
-        self.btn_reboot.clicked.connect(
-            lambda: self.clicked_reboot.emit(self.sign_id)
-        )
-        self.btn_shutdown.clicked.connect(
-            lambda: self.clicked_shutdown.emit(self.sign_id)
-        )
-        self.btn_active.toggled.connect(
-            lambda checked: self.toggled_active.emit(self.sign_id, checked)
-        )
+        self.setting_button.clicked.connect(self._emit_config)
+        self.btn_reboot.clicked.connect(self._emit_reboot)
+        self.btn_shutdown.clicked.connect(self._emit_shutdown)
+        self.btn_active.toggled.connect(self._emit_toggle)
         self.set_comm_status(True, None)
+        self.setUpdatesEnabled(True)
+
+    @QtCore.pyqtSlot()
+    def _emit_config(self) -> None:
+        self.clicked_config.emit(self.sign_id)
+
+    @QtCore.pyqtSlot()
+    def _emit_reboot(self) -> None:
+        self.clicked_reboot.emit(self.sign_id)
+
+    @QtCore.pyqtSlot()
+    def _emit_shutdown(self) -> None:
+        self.clicked_shutdown.emit(self.sign_id)
+
+    @QtCore.pyqtSlot(bool)
+    def _emit_toggle(self, checked: bool) -> None:
+        self.toggled_active.emit(self.sign_id, checked)
 
     def _apply_3d_button_style(self, btn: QtWidgets.QPushButton) -> None:
-        btn.setStyleSheet(
-            """
-QPushButton {
-  padding: 4px 6px;
-  border: 1px solid #8a8a8a;
-  border-radius: 6px;
-  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                              stop:0 #ffffff, stop:1 #e6e6e6);
-}
-QPushButton:pressed {
-  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                              stop:0 #dcdcdc, stop:1 #f6f6f6);
-}
-"""
-        )
+        # 見た目は列のスタイルシート（COLUMN_STYLE_SHEET）の #columnButton で決まる
+        btn.setObjectName("columnButton")
 
     def _make_label(self, text: str) -> QtWidgets.QLabel:
         label = QtWidgets.QLabel(text)
         label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         label.setWordWrap(True)
-        label.setStyleSheet("border: 1px solid #999;")
+        apply_style_sheet(label, STYLE_CELL)
         return label
 
     def _make_pc_status_label(self, text: str) -> QtWidgets.QLabel:
@@ -1167,12 +1908,14 @@ QPushButton:pressed {
         font.setPointSize(PC_STATUS_FONT_SIZE)
         label.setFont(font)
         label.setContentsMargins(0, 0, 0, 0)
-        label.setStyleSheet("border: 1px solid #999;")
+        apply_style_sheet(label, STYLE_CELL)
         return label
 
     def set_pc_status_values(self, values: Dict[str, str]) -> None:
         for key, label in self.pc_status_labels.items():
-            label.setText(values.get(key, "-"))
+            text = values.get(key, "-")
+            if label.text() != text:
+                label.setText(text)
 
     def _handle_media_status(self, status) -> None:
         if status != QtMultimedia.QMediaPlayer.MediaStatus.EndOfMedia:
@@ -1185,20 +1928,42 @@ QPushButton:pressed {
         self.sample_index = (self.sample_index + 1) % len(self.sample_list)
         self._play_current_sample()
 
+    def _ensure_player(self) -> bool:
+        if not HAS_QTMULTIMEDIA:
+            return False
+        if self.player is None:
+            self.video_widget = QtMultimediaWidgets.QVideoWidget()
+            self.preview_stack.addWidget(self.video_widget)
+            self.player = QtMultimedia.QMediaPlayer(self)
+            self.player.setVideoOutput(self.video_widget)
+            self.player.mediaStatusChanged.connect(self._handle_media_status)
+        return True
+
+    def _release_player(self) -> None:
+        if self.player is None:
+            return
+        self.player.stop()
+        self.player.setSource(QtCore.QUrl())
+        self.player.deleteLater()
+        self.player = None
+        if self.video_widget is not None:
+            self.preview_stack.removeWidget(self.video_widget)
+            self.video_widget.deleteLater()
+            self.video_widget = None
+
     def show_preview_message(self, text: str) -> None:
+        self.preview_key = None
         self.preview_label.setText(text)
         self.preview_label.setPixmap(QtGui.QPixmap())
         self.preview_stack.setCurrentWidget(self.preview_label)
-        if self.player:
-            self.player.stop()
+        self._release_player()
         self._current_sample = None
 
     def show_preview_pixmap(self, pixmap: QtGui.QPixmap) -> None:
         self.preview_label.setText("")
         self.preview_label.setPixmap(pixmap)
         self.preview_stack.setCurrentWidget(self.preview_label)
-        if self.player:
-            self.player.stop()
+        self._release_player()
         self._current_sample = None
 
     def set_sample_list(self, samples: List[Path]) -> None:
@@ -1206,6 +1971,7 @@ QPushButton:pressed {
             self.sample_list = samples
             self.sample_index = 0
             self._current_sample = None
+            self._url_cache.clear()
         if not self.sample_list:
             self.show_preview_message("サンプルなし")
             return
@@ -1217,11 +1983,14 @@ QPushButton:pressed {
         self.play_preview(self.sample_list[self.sample_index])
 
     def play_preview(self, sample: Path) -> None:
-        if not self.player or not self.video_widget:
+        if not self._ensure_player():
             self.show_preview_message(sample.name)
             return
         if self._current_sample != sample:
-            self.player.setSource(QtCore.QUrl.fromLocalFile(str(sample)))
+            url = self._url_cache.get(sample)
+            if url is None:
+                url = self._url_cache[sample] = QtCore.QUrl.fromLocalFile(str(sample))
+            self.player.setSource(url)
             self._current_sample = sample
         self.preview_stack.setCurrentWidget(self.video_widget)
         self.player.play()
@@ -1232,37 +2001,26 @@ QPushButton:pressed {
         self.btn_active.setText(label)
         self.btn_active.setChecked(active)
         del blocker
-        if active:
-            self.btn_active.setStyleSheet("background:#e8ffe8; border:2px solid #2e7d32; font-weight:800;")
-        else:
-            self.btn_active.setStyleSheet("background:#c9c9c9; border:2px solid #7a7a7a; font-weight:700;")
+        apply_style_sheet(self.btn_active, STYLE_ACTIVE_BUTTON[bool(active)])
 
     def set_inactive_style(self, inactive: bool) -> None:
+        apply_style_sheet(self, COLUMN_STYLE_SHEET_INACTIVE if inactive else COLUMN_STYLE_SHEET)
         if inactive:
-            self.setStyleSheet("background-color: #c9c9c9; color: #7a7a7a;")
-        else:
-            self.setStyleSheet("")
+            self._release_player()
+            self._current_sample = None
         self.timer_bar.set_column_enabled(not inactive)
 
     def set_comm_status(self, enabled: bool, online: Optional[bool]) -> None:
         if not enabled:
-            self.comm_label.setText("-")
-            self.comm_label.setStyleSheet("background:#c9c9c9; color:#333; border-radius:6px;")
-            return
-        if online is None:
-            self.comm_label.setText("通信--")
-            self.comm_label.setStyleSheet("background:#eeeeee; color:#333; border-radius:6px;")
-            return
-        if online:
-            self.comm_label.setText("通信OK")
-            self.comm_label.setStyleSheet(
-                "background:#2d7ff9; color:#fff; border-radius:6px; font-weight:800;"
-            )
+            text, key = "-", "disabled"
+        elif online is None:
+            text, key = "通信--", "unknown"
+        elif online:
+            text, key = "通信OK", "ok"
         else:
-            self.comm_label.setText("通信NG")
-            self.comm_label.setStyleSheet(
-                "background:#e53935; color:#fff; border-radius:6px; font-weight:800;"
-            )
+            text, key = "通信NG", "ng"
+        set_text_if_changed(self.comm_label, text)
+        apply_style_sheet(self.comm_label, STYLE_COMM[key])
 
 
 class UiDispatcher(QtCore.QObject):
@@ -1278,41 +2036,92 @@ class UiDispatcher(QtCore.QObject):
 
 
 class ControllerWindow(QtWidgets.QMainWindow):
+    # watchdog スレッドからの再計算要求（UI スレッドへキューイングされる）
+    recompute_requested = QtCore.pyqtSignal()
+    # 再計算のあと（どのスレッドからでも）次の切替時刻のタイマーを UI スレッドで掛け直す
+    transition_reschedule_requested = QtCore.pyqtSignal()
+    RECOMPUTE_DEBOUNCE_MS = 100
+    # テレメトリ・接続確認の周期。最小化/非表示の間は間隔を延ばす
+    POLL_INTERVAL_MS = 10000
+    POLL_INTERVAL_HIDDEN_MS = 60000
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
         self.resize(1400, 900)
+        # ボタンの 3D 表示などは個々に setStyleSheet せず、ここで 1 回だけ解析させる
+        self.setStyleSheet(CONTROLLER_STYLE_SHEET)
 
         self.settings = load_json(SETTINGS_PATH, {})
         self.inventory = load_json(INVENTORY_PATH, {})
-        self.ai_status = load_json(AI_STATUS_PATH, {})
+        self.ai_status: dict = {}
+        # 最後に読み込んだ ai_status.json の st_mtime_ns（変化がなければ読み直さない）
+        self._ai_status_loaded_mtime_ns: Optional[int] = None
+        self._load_ai_status_if_changed()
         self.ai_status_stale = False
 
         self.sign_states: Dict[str, SignState] = {}
+        self._sorted_sign_states: List[Tuple[str, SignState]] = []
+        # _update_column で前回反映した内容（状態 + config キー）。同じなら列の表示更新を省く
+        self._column_fp: Dict[str, tuple] = {}
         self._preview_enabled = self.settings.get("preview_enabled", True)
         self._executor = ThreadPoolExecutor(max_workers=self.settings.get("thread_workers", 8))
+        # 動画同期（サイン単位）用。同期のたびにプールを作り直さない
+        self._sync_executor = ThreadPoolExecutor(
+            max_workers=self.settings.get("sync_workers", 4),
+            thread_name_prefix="sync",
+        )
         self._update_lock = threading.Lock()
+        # ローカル active.json に最後に書いた値（変化がなければ書き直さない）
+        self._active_written: Dict[str, Optional[str]] = {}
+        # サイン別 config.json の (stat_fingerprint, config, config_cache_key)
+        self._sign_config_cache: Dict[str, Tuple[Tuple[int, int, int], dict, str]] = {}
         self._observer = None
-        self._ai_status_mtime: Optional[float] = None
+        self._ai_status_mtime: Optional[int] = None
         self._log_stream = None
         self._log_handler = None
         self._last_log_text = ""
         self._last_log_count = 0
         self._log_buffer = ""
+        # _shorten_log_line 用。フォントが変わったときだけ作り直す
+        self._log_metrics: Optional[QtGui.QFontMetrics] = None
+        self._log_metrics_font: Optional[QtGui.QFont] = None
         self._header_labels: Dict[str, QtWidgets.QPushButton] = {}
+        # 最後に適用した列幅と、リサイズ連打をまとめるための保留フラグ
+        self._last_col_w = -1
+        self._resize_pending = False
         self._column_widgets: Dict[str, SignageColumnWidget] = {}
         self.ai_level_badge: Optional[QtWidgets.QLabel] = None
+        self._ai_badge_state: Optional[Tuple[int, bool]] = None
         self.left_panel: Optional[QtWidgets.QWidget] = None
         self.header_buttons: List[QtWidgets.QPushButton] = []
         self.columns: List[SignageColumnWidget] = []
         self._emergency_override_enabled: bool = False
         self._emergency_override_channel: str = EMERGENCY_CHANNEL
-        self._remote_status_cache: Dict[str, dict] = {}
+        # sign -> ((st_mtime_ns, st_size), payload)。ワーカーは複製して差し替え、読む側はロック無しで参照する
+        self._remote_status_cache: Dict[str, CachedStatus] = {}
+        self._remote_status_cache_lock = threading.Lock()
         self._remote_status_pending: Dict[str, dict] = {}
+        # (期限, 端末名) のヒープ。tick ごとに期限切れの分だけ取り出す
+        self._pending_expiry_heap: List[Tuple[float, str]] = []
         self._remote_status_log_state: Dict[str, str] = {}
+        self._ping_cache: Dict[str, Tuple[float, bool]] = {}
+        # プレビュー静止画のデコード中ジョブ（QPixmapCache のキー -> Future）。UI スレッドからのみ触る
+        self._preview_jobs: Dict[str, Future] = {}
+        # channel -> (フォルダの st_mtime_ns, サンプル動画一覧)
+        self._sample_list_cache: Dict[str, Tuple[int, List[Path]]] = {}
+        # (ip, port) -> (確認時刻, 到達可否)。書込み失敗時は捨てる
+        self._tcp_cache: Dict[Tuple[str, int], Tuple[float, bool]] = {}
+        # sign_name -> (確認時刻, 到達可否, 理由)。書込み失敗時は捨てる
+        self._share_reach_cache: Dict[str, Tuple[float, bool, str]] = {}
         self._ui_busy: bool = False
         self._busy_label: str = ""
         self._ui_dispatcher = UiDispatcher(self)
+        # 電源コマンドの command_id 用の通し番号
+        self._cmd_seq = itertools.count()
+        # ワーカーからの列更新依頼。UI 側で処理される前に溜まった分は 1 回の呼び出しでまとめて反映する
+        self._column_update_lock = threading.Lock()
+        self._column_update_pending: Dict[str, SignState] = {}
         # ---- Debug trace (root cause investigation) ----
         self._dbg_enabled = bool(self.settings.get("debug_trace_enabled", True))
         self._dbg_hang_seconds = int(self.settings.get("debug_hang_seconds", 60))
@@ -1344,6 +2153,16 @@ class ControllerWindow(QtWidgets.QMainWindow):
         # per-sign last log state is already self._remote_status_log_state
         self._telemetry_timer: Optional[QtCore.QTimer] = None
         self._connectivity_timer: Optional[QtCore.QTimer] = None
+        # 画面に見えているか（最小化/非表示の間は列の表示更新を省く）
+        self._ui_visible = True
+        # 隠れている間に届いた各サインの最新 payload（None = 不明表示に戻す）。表示に戻ったら全部反映する
+        self._pc_status_deferred: Dict[str, Optional[dict]] = {}
+        # 監視イベントや操作で立て、次の接続確認 tick で消費する。立っていなければ heartbeat 間隔まで省略
+        self._connectivity_dirty = True
+        self._connectivity_last_poll = 0.0
+        self._connectivity_heartbeat = float(
+            self.settings.get("connectivity_heartbeat_seconds", CONNECTIVITY_HEARTBEAT_SEC)
+        )
 
         self._init_ui()
         QtCore.QTimer.singleShot(0, self.apply_dynamic_column_widths)
@@ -1351,21 +2170,29 @@ class ControllerWindow(QtWidgets.QMainWindow):
         self._load_sign_states()
         self._ensure_config_and_content_layout()
         self.refresh_summary()
+        # 1 回の保存で複数の変更イベントが来るので、最後のイベントから一定時間後に 1 回だけ再計算する
+        self._recompute_debounce = QtCore.QTimer(self)
+        self._recompute_debounce.setSingleShot(True)
+        self._recompute_debounce.setInterval(self.RECOMPUTE_DEBOUNCE_MS)
+        self._recompute_debounce.timeout.connect(self.recompute_all)
+        self.recompute_requested.connect(self._recompute_debounce.start)
         self.start_watchers()
 
+        # 毎分のポーリングはせず、次のルール切替（または ai_status が STALE になる時刻）にだけ起きる
         self.timer_poll = QtCore.QTimer(self)
-        self.timer_poll.setInterval(60 * 1000)
+        self.timer_poll.setSingleShot(True)
         self.timer_poll.timeout.connect(self.check_timer_transition)
-        self.timer_poll.start()
+        self.transition_reschedule_requested.connect(self._schedule_next_transition)
+        self._schedule_next_transition()
 
         self._telemetry_timer = QtCore.QTimer(self)
-        self._telemetry_timer.setInterval(10000)
+        self._telemetry_timer.setInterval(self.POLL_INTERVAL_MS)
         self._telemetry_timer.timeout.connect(self.refresh_remote_telemetry)
         self._telemetry_timer.start()
         self.refresh_remote_telemetry()
 
         self._connectivity_timer = QtCore.QTimer(self)
-        self._connectivity_timer.setInterval(10000)
+        self._connectivity_timer.setInterval(self.POLL_INTERVAL_MS)
         self._connectivity_timer.timeout.connect(self.poll_connectivity_silent)
         self._connectivity_timer.start()
 
@@ -1373,7 +2200,9 @@ class ControllerWindow(QtWidgets.QMainWindow):
         self._dbg_watchdog_timer = QtCore.QTimer(self)
         self._dbg_watchdog_timer.setInterval(1000)  # 1秒周期
         self._dbg_watchdog_timer.timeout.connect(self._dbg_watchdog_tick)
-        self._dbg_watchdog_timer.start()
+        # ダンプしない設定なら watchdog は回さない
+        if self._dbg_enabled and self._dbg_dump_enabled:
+            self._dbg_watchdog_timer.start()
 
     def _ensure_config_and_content_layout(self) -> None:
         for channel in CHANNELS:
@@ -1384,7 +2213,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
             ensure_dir(sign_dir)
             config_path = sign_dir / "config.json"
             if not config_path.exists():
-                write_json_atomic(config_path, default_sign_config(sign_name))
+                write_json_atomic(config_path, default_sign_config(sign_name), keep_backup=True)
 
     def _init_ui(self) -> None:
         central = QtWidgets.QWidget()
@@ -1437,6 +2266,8 @@ class ControllerWindow(QtWidgets.QMainWindow):
         layout.addLayout(header_layout)
 
         signage_grid_container = QtWidgets.QWidget()
+        # 20 列分のウィジェットを積み終わるまで再描画要求を止める
+        signage_grid_container.setUpdatesEnabled(False)
         signage_grid = QtWidgets.QGridLayout(signage_grid_container)
         signage_grid.setContentsMargins(0, 0, 0, 0)
         signage_grid.setHorizontalSpacing(GAP_PX)
@@ -1452,7 +2283,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
             button = QtWidgets.QPushButton(name)
             button.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
             button.setFixedHeight(42)
-            button.setStyleSheet("border: 1px solid #999;")
+            apply_style_sheet(button, STYLE_CELL)
             signage_grid.addWidget(button, 0, BASE_COL + idx)
             self.header_buttons.append(button)
             self._header_labels[name.replace("Signage ", "Signage")] = button
@@ -1487,7 +2318,8 @@ class ControllerWindow(QtWidgets.QMainWindow):
         for idx in range(N_SIGNAGE):
             name = f"Signage{idx + 1:02d}"
             sign_id = f"Sign{idx + 1:02d}"
-            column = SignageColumnWidget(name, sign_id)
+            # 最初から親を渡して addWidget 時の付け替えを避ける
+            column = SignageColumnWidget(name, sign_id, signage_grid_container)
             column.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
             column.setMinimumWidth(0)
             self.columns.append(column)
@@ -1502,6 +2334,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
         for idx in range(N_SIGNAGE):
             signage_grid.setColumnStretch(BASE_COL + idx, 1)
 
+        signage_grid_container.setUpdatesEnabled(True)
         layout.addWidget(signage_grid_container)
 
         log_label = QtWidgets.QLabel("ログ")
@@ -1532,9 +2365,14 @@ class ControllerWindow(QtWidgets.QMainWindow):
         QtCore.QTimer.singleShot(800, self.check_connectivity)
 
     def apply_dynamic_column_widths(self) -> None:
+        self._resize_pending = False
         total_w = self.centralWidget().width()
         usable = total_w - LEFT_COL_WIDTH - OUTER_MARGIN * 2 - GAP_PX * N_SIGNAGE
         col_w = max(45, int(usable / N_SIGNAGE))
+        if col_w == self._last_col_w:
+            return
+        if self.columns:
+            self._last_col_w = col_w
 
         if self.left_panel:
             self.left_panel.setFixedWidth(LEFT_COL_WIDTH)
@@ -1551,7 +2389,9 @@ class ControllerWindow(QtWidgets.QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        QtCore.QTimer.singleShot(0, self.apply_dynamic_column_widths)
+        if not self._resize_pending:
+            self._resize_pending = True
+            QtCore.QTimer.singleShot(0, self.apply_dynamic_column_widths)
 
     def _make_row_label(self, text: str, height: int) -> QtWidgets.QLabel:
         label = QtWidgets.QLabel(text)
@@ -1562,59 +2402,13 @@ class ControllerWindow(QtWidgets.QMainWindow):
         return label
 
     def _apply_3d_button_style(self, btn: QtWidgets.QPushButton) -> None:
-        btn.setStyleSheet(
-            """
-QPushButton {
-  padding: 6px 10px;
-  border: 1px solid #8a8a8a;
-  border-radius: 6px;
-  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                              stop:0 #ffffff, stop:1 #e6e6e6);
-}
-QPushButton:hover {
-  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                              stop:0 #ffffff, stop:1 #f0f0f0);
-}
-QPushButton:pressed {
-  background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                              stop:0 #dcdcdc, stop:1 #f6f6f6);
-  border: 1px solid #6f6f6f;
-}
-QPushButton:disabled {
-  background: #d6d6d6;
-  color: #777;
-}
-"""
-        )
+        # 見た目はウィンドウのスタイルシート（CONTROLLER_STYLE_SHEET）の #btn3d で決まる
+        btn.setObjectName("btn3d")
 
     def _apply_emergency_button_style(self) -> None:
         if not hasattr(self, "btn_emergency_override") or self.btn_emergency_override is None:
             return
-        self.btn_emergency_override.setStyleSheet(
-            """
-QPushButton {
-  padding: 6px 10px;
-  border: 1px solid #8a8a8a;
-  border-radius: 8px;
-  background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #e6e6e6);
-}
-QPushButton:checked {
-  background: #e53935;
-  color: #fff;
-  font-weight: 900;
-  font-size: 14px;
-  border: 1px solid #7a1f1f;
-}
-QPushButton:checked:disabled {
-  background: #e53935;
-  color: #fff;
-}
-QPushButton:disabled {
-  background: #d6d6d6;
-  color: #777;
-}
-"""
-        )
+        self.btn_emergency_override.setObjectName("btnEmergency")
 
     def _make_pc_status_row_label(self, text: str) -> QtWidgets.QLabel:
         label = QtWidgets.QLabel(text)
@@ -1634,9 +2428,7 @@ QPushButton:disabled {
         label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         label.setFixedHeight(26)
         label.setMinimumWidth(120)
-        label.setStyleSheet(
-            "background:#ffffff; color:#111; border:1px solid #bbb; border-radius:8px; font-weight:800;"
-        )
+        apply_style_sheet(label, STYLE_CHIP[0])
         return label
 
     def _make_status_cell(self) -> QtWidgets.QLabel:
@@ -1646,72 +2438,37 @@ QPushButton:disabled {
         font = label.font()
         font.setPointSize(8)
         label.setFont(font)
-        label.setStyleSheet(
-            "background:#ffffff; color:#111; border:1px solid #bbb; border-radius:8px; padding:2px 4px;"
-        )
+        apply_style_sheet(label, STYLE_STATUS[0])
         return label
 
     def _chip_set_value(self, label: QtWidgets.QLabel, value: Optional[float], unit: str, kind: str) -> None:
         title = label.property("title") or ""
         if value is None:
-            label.setText(f"{title}: -")
-            label.setStyleSheet(
-                "background:#ffffff; color:#111; border:1px solid #bbb; border-radius:8px; font-weight:800;"
-            )
+            set_text_if_changed(label, f"{title}: -")
+            apply_style_sheet(label, STYLE_CHIP[0])
             return
         try:
             numeric = float(value)
         except (TypeError, ValueError):
-            label.setText(f"{title}: -")
-            label.setStyleSheet(
-                "background:#ffffff; color:#111; border:1px solid #bbb; border-radius:8px; font-weight:800;"
-            )
+            set_text_if_changed(label, f"{title}: -")
+            apply_style_sheet(label, STYLE_CHIP[0])
             return
-        if kind == "load":
-            warn_threshold = 70
-            danger_threshold = 90
-        else:
-            warn_threshold = 55
-            danger_threshold = 65
-        if numeric >= danger_threshold:
-            background = "#e53935"
-            color = "#fff"
-        elif numeric >= warn_threshold:
-            background = "#ffd6e7"
-            color = "#111"
-        else:
-            background = "#ffffff"
-            color = "#111"
-        label.setText(f"{title}: {numeric:.1f}{unit}")
-        label.setStyleSheet(
-            f"background:{background}; color:{color}; border:1px solid #bbb; border-radius:8px; font-weight:800;"
-        )
-
-    def _status_style(self, severity: int) -> Tuple[str, str]:
-        if severity >= 2:
-            return "#e53935", "#fff"
-        if severity == 1:
-            return "#ffd6e7", "#111"
-        return "#ffffff", "#111"
+        warn, danger = SEVERITY_THRESHOLDS.get(kind, SEVERITY_THRESHOLDS["temp"])
+        severity = (numeric >= warn) + (numeric >= danger)
+        set_text_if_changed(label, f"{title}: {numeric:.1f}{unit}")
+        apply_style_sheet(label, STYLE_CHIP[severity])
 
     def _set_status_label(self, label: QtWidgets.QLabel, text: str, severity: int) -> None:
-        background, color = self._status_style(severity)
-        label.setText(text)
-        label.setStyleSheet(
-            f"background:{background}; color:{color}; border:1px solid #bbb; border-radius:8px; padding:2px 4px;"
-        )
+        set_text_if_changed(label, text)
+        apply_style_sheet(label, STYLE_STATUS[min(max(severity, 0), 2)])
 
     def _set_status_error(self, label: QtWidgets.QLabel, text: str) -> None:
-        label.setText(text)
-        label.setStyleSheet(
-            "background:#e53935; color:#fff; border:1px solid #bbb; border-radius:8px; padding:2px 4px;"
-        )
+        set_text_if_changed(label, text)
+        apply_style_sheet(label, STYLE_STATUS[2])
 
     def _set_status_inactive(self, label: QtWidgets.QLabel, text: str) -> None:
-        label.setText(text)
-        label.setStyleSheet(
-            "background:#c9c9c9; color:#666; border:1px solid #bbb; border-radius:8px; padding:2px 4px;"
-        )
+        set_text_if_changed(label, text)
+        apply_style_sheet(label, STYLE_STATUS_INACTIVE)
 
     def _calc_severity(self, value: Optional[float], kind: str) -> Optional[int]:
         if value is None:
@@ -1720,17 +2477,8 @@ QPushButton:disabled {
             numeric = float(value)
         except (TypeError, ValueError):
             return None
-        if kind == "load":
-            warn_threshold = 70
-            danger_threshold = 90
-        else:
-            warn_threshold = 55
-            danger_threshold = 65
-        if numeric >= danger_threshold:
-            return 2
-        if numeric >= warn_threshold:
-            return 1
-        return 0
+        warn, danger = SEVERITY_THRESHOLDS.get(kind, SEVERITY_THRESHOLDS["temp"])
+        return (numeric >= warn) + (numeric >= danger)
 
     def _format_metric(self, value: Optional[float], unit: str, decimals: int = 1) -> str:
         if value is None:
@@ -1743,31 +2491,24 @@ QPushButton:disabled {
 
     def _set_ssd_usage_label(self, label: QtWidgets.QLabel, used_gb: Optional[float], total_gb: Optional[float]) -> None:
         if used_gb is None or total_gb in (None, 0):
-            label.setText("SSD使用状況 不明")
-            label.setStyleSheet(
-                "background:#ffffff; color:#111; border:1px solid #bbb; border-radius:8px; padding:2px 8px;"
-            )
+            set_text_if_changed(label, "SSD使用状況 不明")
+            apply_style_sheet(label, STYLE_SSD[0])
             return
         try:
             usage_percent = (float(used_gb) / float(total_gb)) * 100
         except (TypeError, ValueError, ZeroDivisionError):
             self._set_status_error(label, "SSD使用状況 エラー")
             return
-        if usage_percent >= 90:
-            severity = 2
-        elif usage_percent >= 80:
-            severity = 1
-        else:
-            severity = 0
-        background, color = self._status_style(severity)
-        label.setText(f"SSD使用状況 {float(used_gb):.1f}GB/{float(total_gb):.0f}GB")
-        label.setStyleSheet(
-            f"background:{background}; color:{color}; border:1px solid #bbb; border-radius:8px; padding:2px 8px;"
-        )
+        warn, danger = SEVERITY_THRESHOLDS["ssd"]
+        severity = (usage_percent >= warn) + (usage_percent >= danger)
+        set_text_if_changed(label, f"SSD使用状況 {float(used_gb):.1f}GB/{float(total_gb):.0f}GB")
+        apply_style_sheet(label, STYLE_SSD[severity])
 
     def _format_pc_value(self, value: Optional[float], decimals: int = 1) -> str:
         if value is None:
             return "不明"
+        if isinstance(value, (int, float)):
+            return f"{value:.{decimals}f}"
         try:
             numeric = float(value)
         except (TypeError, ValueError):
@@ -1778,23 +2519,30 @@ QPushButton:disabled {
         if not value:
             return "不明"
         try:
-            parsed = datetime.fromisoformat(value)
-        except Exception:
+            return format_pc_timestamp(value)
+        except TypeError:
+            # ハッシュできない値（壊れた pc_status.json）
             return "不明"
-        return parsed.strftime("%m/%d %H:%M:%S")
 
     def _build_pc_status_values(self, payload: Optional[dict]) -> Dict[str, str]:
-        values = {key: "不明" for key, _ in PC_STATUS_ITEMS}
+        values = _PC_STATUS_DEFAULT.copy()
         if not isinstance(payload, dict):
             return values
 
         cpu_load = payload.get("cpu_total_percent")
         mem_used = payload.get("mem_used_percent")
-        used_gb = payload.get("ssd", {}).get("used_gb")
-        total_gb = payload.get("ssd", {}).get("total_gb")
-
-        auto_play = payload.get("auto_play", {}) if isinstance(payload.get("auto_play"), dict) else {}
-        player = payload.get("player", {}) if isinstance(payload.get("player"), dict) else {}
+        ssd = payload.get("ssd")
+        if not isinstance(ssd, dict):
+            ssd = _EMPTY
+        used_gb = ssd.get("used_gb")
+        total_gb = ssd.get("total_gb")
+
+        auto_play = payload.get("auto_play")
+        if not isinstance(auto_play, dict):
+            auto_play = _EMPTY
+        player = payload.get("player")
+        if not isinstance(player, dict):
+            player = _EMPTY
         running = auto_play.get("running")
         alive = player.get("alive")
         if running is True:
@@ -1818,24 +2566,33 @@ QPushButton:disabled {
         return values
 
     def _set_pc_status_values(self, state: SignState, payload: Optional[dict]) -> None:
-        column = self._column_widgets.get(state.name.replace("Sign", "Signage"))
+        column = self._column_widgets.get(state.column_key)
         if not column:
             return
+        if not self._ui_visible:
+            # 描画はしないが、オフライン化（None）を含め最新の値だけは覚えておく
+            self._pc_status_deferred[state.name] = payload
+            return
         values = self._build_pc_status_values(payload)
-        column.set_pc_status_values(values)
-        playback_label = column.pc_status_labels.get("playback_state")
-        if playback_label:
-            if values.get("playback_state") == "停止":
-                playback_label.setStyleSheet(
-                    "background:#e53935; color:#ffffff; border:1px solid #999; font-weight:900;"
-                )
-            else:
-                playback_label.setStyleSheet("border:1px solid #999;")
+        if column.property("_pc_status_values") == values:
+            return
+        column.setProperty("_pc_status_values", values)
+        # 列内の複数ラベル更新をまとめ、再描画は列ごとに 1 回にする。
+        # 中央ウィジェット全体で止めると再開時に毎 tick 全面再描画になるため列単位にとどめる
+        column.setUpdatesEnabled(False)
+        try:
+            column.set_pc_status_values(values)
+            playback_label = column.pc_status_labels.get("playback_state")
+            if playback_label:
+                stopped = values.get("playback_state") == "停止"
+                apply_style_sheet(playback_label, STYLE_PLAYBACK_STOPPED if stopped else STYLE_CELL)
+        finally:
+            column.setUpdatesEnabled(True)
 
     def _setup_log_stream(self) -> None:
         def excepthook(exc_type, exc_value, exc_traceback):
             formatted = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-            logging.error("%s", formatted)
+            logger.error("%s", formatted)
             try:
                 sys.__stderr__.write(formatted)
                 sys.__stderr__.flush()
@@ -1854,19 +2611,22 @@ QPushButton:disabled {
 
     def load_pc_status(self, state: SignState) -> dict:
         path = self._remote_status_path(state)
+        # 存在確認と指紋を 1 回の stat で済ませる（SMB 越しの往復を減らす）
         try:
-            if not path.exists():
-                return {"ok": False, "error": "not_found"}
+            st = os.stat(path)
         except Exception:
             return {"ok": False, "error": "not_found"}
-        fingerprint = stat_fingerprint(path)
+        fingerprint = (st.st_mtime_ns, st.st_size)
         cached = self._remote_status_cache.get(state.name)
-        if cached and cached.get("fingerprint") == fingerprint:
-            return {"ok": True, "payload": cached.get("payload"), "cached": True}
+        if cached and cached.fingerprint == fingerprint:
+            return {"ok": True, "payload": cached.payload, "cached": True}
         payload = safe_read_json(path, default=None, retries=3)
         if payload is None:
             return {"ok": False, "error": "read_failed"}
-        self._remote_status_cache[state.name] = {"fingerprint": fingerprint, "payload": payload}
+        with self._remote_status_cache_lock:
+            new_cache = dict(self._remote_status_cache)
+            new_cache[state.name] = CachedStatus(fingerprint, payload)
+            self._remote_status_cache = new_cache
         return {"ok": True, "payload": payload, "cached": False}
 
     def refresh_remote_telemetry(self) -> None:
@@ -1885,8 +2645,27 @@ QPushButton:disabled {
             for state in self.sign_states.values():
                 self._remote_status_pending.pop(state.name, None)
                 self._set_pc_status_values(state, None)
+            self._pending_expiry_heap.clear()
             return
 
+        # timeout（future.cancel はUNC詰まりには効かないので、触る前に落とす）
+        timeout_sec = 2.0
+
+        # 期限切れの pending だけをヒープから取り出してタイムアウト扱いにする（巡回順を待たない）
+        heap = self._pending_expiry_heap
+        while heap and heap[0][0] <= now:
+            deadline, name = heapq.heappop(heap)
+            pending = self._remote_status_pending.get(name)
+            # 回収済み・再投入済み（古い期限）・完了済み（下のループで回収）は対象外
+            if not pending or pending["deadline"] != deadline or pending["future"].done():
+                continue
+            # cancelしてもUNCが詰まっていると止まらないことがあるので、
+            # “結果は捨てる”扱いでUIを先に進める
+            self._remote_status_pending.pop(name, None)
+            state = self.sign_states.get(name)
+            if state is not None:
+                self._apply_remote_status(state, {"ok": False, "error": "timeout"})
+
         # round-robin 対象を決定
         batch = max(1, self._telemetry_batch_size)
         start = self._telemetry_rr_index % len(targets)
@@ -1898,47 +2677,76 @@ QPushButton:disabled {
                 break
         self._telemetry_rr_index = (start + batch) % len(targets)
 
-        # timeout（future.cancel はUNC詰まりには効かないので、触る前に落とす）
-        timeout_sec = 2.0
-
+        # NG 端末のうち再試行時刻を過ぎたものを 1 台だけ相乗りさせる（次の巡回を待たずに復帰を拾う）
+        # 全台が既に今回の巡回に入っているなら相乗りの候補は無い
+        if len(picked) < len(targets):
+            picked_names = {s.name for s in picked}
+            retry_name = None
+            retry_at = None
+            for name, meta in self._telemetry_backoff.items():
+                if name in picked_names or int(meta.get("fail_count", 0)) <= 0:
+                    continue
+                next_allowed = meta.get("next_allowed", 0)
+                if next_allowed <= now and (retry_at is None or next_allowed < retry_at):
+                    retry_name, retry_at = name, next_allowed
+            retry_state = self.sign_states.get(retry_name) if retry_name else None
+            if retry_state is not None and retry_state.exists and retry_state.enabled:
+                picked.append(retry_state)
+
+        # UNC(Path.exists/open)を触る前に、SMBポート(445)だけを短時間で確認する（NGならUNCアクセスしない）。
+        # 確認が必要な端末を先に洗い出し、全台を同時に 1 回で確認する（1 台ずつ 0.2 秒待たない）
+        # ループ内で何度も引く属性はローカルに束ねておく
+        skip_until_map = self._pc_status_skip_until
+        backoff = self._telemetry_backoff
+        pending_map = self._remote_status_pending
+        apply_status = self._apply_remote_status
+
+        probe_ips = []
+        for state in picked:
+            meta = backoff.get(state.name)
+            waiting = (meta and now < meta.get("next_allowed", 0)) or state.name in pending_map
+            if now < skip_until_map.get(state.name, 0) or not waiting:
+                probe_ips.append(state.ip)
+        smb_ok = multi_tcp_probe(probe_ips, 445, timeout=0.2)
+
+        submit = self._executor.submit
+        load_fn = self.load_pc_status
+        expiry_heap = self._pending_expiry_heap
         for state in picked:
-            skip_until = self._pc_status_skip_until.get(state.name, 0)
+            name = state.name
+            skip_until = skip_until_map.get(name, 0)
             if now < skip_until:
-                if not self._fast_smb_reachable(state.ip, timeout_sec=0.2):
-                    self._apply_remote_status(state, {"ok": False, "error": "smb_unreachable"})
+                if not smb_ok.get(state.ip, False):
+                    apply_status(state, {"ok": False, "error": "smb_unreachable"})
                 continue
             # backoff判定
-            meta = self._telemetry_backoff.get(state.name)
+            meta = backoff.get(name)
             if meta and now < meta.get("next_allowed", 0):
                 continue
 
-            # 既にpendingなら結果回収/タイムアウト処理だけ
-            pending = self._remote_status_pending.get(state.name)
+            # 既にpendingなら結果回収だけ（タイムアウトは先頭のヒープ処理で済んでいる）
+            pending = pending_map.get(name)
             if pending:
                 future = pending["future"]
-                started = pending["started"]
                 if future.done():
-                    self._remote_status_pending.pop(state.name, None)
+                    pending_map.pop(name, None)
                     try:
                         result = future.result()
                     except Exception as exc:
                         result = {"ok": False, "error": str(exc)}
-                    self._apply_remote_status(state, result)
-                elif now - started > timeout_sec:
-                    # cancelしてもUNCが詰まっていると止まらないことがあるので、
-                    # “結果は捨てる”扱いでUIを先に進める
-                    self._remote_status_pending.pop(state.name, None)
-                    self._apply_remote_status(state, {"ok": False, "error": "timeout"})
+                    apply_status(state, result)
                 continue
 
             # 445チェックで落とす（ここが最重要）
-            if not self._fast_smb_reachable(state.ip, timeout_sec=0.2):
-                self._apply_remote_status(state, {"ok": False, "error": "smb_unreachable"})
+            if not smb_ok.get(state.ip, False):
+                apply_status(state, {"ok": False, "error": "smb_unreachable"})
                 continue
 
             # ここまで来たらUNCを触る（ワーカーへ）
-            future = self._executor.submit(self.load_pc_status, state)
-            self._remote_status_pending[state.name] = {"future": future, "started": now}
+            future = submit(load_fn, state)
+            deadline = now + timeout_sec
+            pending_map[name] = {"future": future, "started": now, "deadline": deadline}
+            heapq.heappush(expiry_heap, (deadline, name))
 
     def _apply_remote_status(self, state: SignState, result: dict) -> None:
         now = time_module.monotonic()
@@ -1948,7 +2756,9 @@ QPushButton:disabled {
             meta["fail_count"] = int(meta.get("fail_count", 0)) + 1
             base = float(self._telemetry_min_interval_ng)
             maxv = float(self._telemetry_max_interval_ng)
-            interval = min(maxv, base * (2 ** max(0, meta["fail_count"] - 1)))
+            cap = min(maxv, base * (2 ** max(0, meta["fail_count"] - 1)))
+            # 同時に落ちた端末の再試行が同じ tick に揃わないよう、[base, cap] で散らす
+            interval = random.uniform(base, cap) if cap > base else cap
             meta["next_allowed"] = now + interval
             self._telemetry_backoff[state.name] = meta
 
@@ -1958,7 +2768,7 @@ QPushButton:disabled {
             # ログはエラーのみ（同一内容は連打しない）
             log_line = f"[ERR] {state.name} pc_status取得失敗 ({reason})"
             if self._remote_status_log_state.get(state.name) != log_line:
-                logging.info("%s", log_line)
+                logger.info("%s", log_line)
                 self._remote_status_log_state[state.name] = log_line
 
         def clear_backoff_ok() -> None:
@@ -2006,8 +2816,10 @@ QPushButton:disabled {
     def _replace_last_log_line(self, text: str) -> None:
         cursor = self.log_view.textCursor()
         cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-        cursor.select(QtGui.QTextCursor.SelectionType.BlockUnderCursor)
-        cursor.removeSelectedText()
+        # BlockUnderCursor は直前の改行まで選択して行が連結されるため、行内だけを選択する
+        cursor.movePosition(
+            QtGui.QTextCursor.MoveOperation.StartOfBlock, QtGui.QTextCursor.MoveMode.KeepAnchor
+        )
         cursor.insertText(text)
         cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
         self.log_view.setTextCursor(cursor)
@@ -2055,14 +2867,9 @@ QPushButton:disabled {
         if not reason:
             return ""
         lower = reason.lower()
-        if "timeout" in lower:
-            return "timeout"
-        if "permission" in lower or "access" in lower or "権限" in reason or "アクセス" in reason:
-            return "permission"
-        if "json" in lower:
-            return "json_error"
-        if "到達不可" in reason or "unreachable" in lower or "smb_unreachable" in lower:
-            return "unreachable"
+        for needle, category in RESULT_REASON_RULES:
+            if needle in lower:
+                return category
         return reason
 
     def _build_pc_result(self, state: SignState, ok: bool, reason: str, phase: str) -> dict:
@@ -2081,9 +2888,9 @@ QPushButton:disabled {
             ok = bool(result.get("ok"))
             reason = result.get("reason") or "error"
             if ok:
-                self._ui_call(lambda oid=op_id, s=sign: self._op_mark_ok(oid, s))
+                self._ui_call(functools.partial(self._op_mark_ok, op_id, sign), label="op_mark_ok")
             else:
-                self._ui_call(lambda oid=op_id, s=sign, r=reason: self._op_mark_ng(oid, s, r))
+                self._ui_call(functools.partial(self._op_mark_ng, op_id, sign, reason), label="op_mark_ng")
 
     def _op_format_result(self, op_id: str) -> str:
         r = self._op_results.get(op_id, {"ok": set(), "ng": {}})
@@ -2091,7 +2898,7 @@ QPushButton:disabled {
         ng_count = len(r["ng"])
         return f" OK:{ok_count} 失敗:{ng_count}"
 
-    def _log_op_append(self, op_id: str, suffix: str) -> None:
+    def _log_op_append(self, op_id: str, *suffixes: str) -> None:
         block_no = self._op_lines.get(op_id)
         if block_no is None:
             return
@@ -2100,20 +2907,24 @@ QPushButton:disabled {
         if not block.isValid():
             return
         cursor = QtGui.QTextCursor(block)
+        # 複数の追記も 1 つの編集ブロックにまとめ、レイアウト更新を 1 回にする
+        cursor.beginEditBlock()
         cursor.movePosition(QtGui.QTextCursor.MoveOperation.EndOfBlock)
-        cursor.insertText(suffix)
+        cursor.insertText("".join(suffixes))
+        cursor.endEditBlock()
         self.log_view.moveCursor(QtGui.QTextCursor.MoveOperation.End)
 
     def _log_op_done(self, op_id: str) -> None:
         label = self._op_done_labels.pop(op_id, "")
-        if label:
-            self._log_op_append(op_id, f" {label}")
-        self._log_op_append(op_id, self._op_format_result(op_id))
-        self._log_op_append(op_id, " 【完了】")
+        self._log_op_append(
+            op_id,
+            f" {label}" if label else "",
+            self._op_format_result(op_id),
+            " 【完了】",
+        )
 
     def _log_op_error(self, op_id: str, reason: str) -> None:
-        self._log_op_append(op_id, self._op_format_result(op_id))
-        self._log_op_append(op_id, f" 【エラー】({reason})")
+        self._log_op_append(op_id, self._op_format_result(op_id), f" 【エラー】({reason})")
 
     def _log_reject(self, title: str, reason: str) -> None:
         now = QtCore.QDateTime.currentDateTime().toString("yyyy/MM/dd HH:mm:ss")
@@ -2123,11 +2934,15 @@ QPushButton:disabled {
         if not getattr(self, "_dbg_enabled", False):
             return
         try:
-            logging.debug("[DBG] " + (msg % args if args else msg))
+            # 整形はハンドラ側で出力時に行う
+            if args:
+                logger.debug("[DBG] " + msg, *args)
+            else:
+                logger.debug("[DBG] %s", msg)
         except Exception:
             # ログで落ちないように
             try:
-                logging.debug("[DBG] %s", msg)
+                logger.debug("[DBG] %s", msg)
             except Exception:
                 pass
 
@@ -2141,7 +2956,7 @@ QPushButton:disabled {
         if not getattr(self, "_dbg_dump_enabled", False):
             return
         try:
-            dump_path = LOG_DIR / f"thread_dump_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+            dump_path = LOG_DIR / f"thread_dump_{time_module.strftime('%Y%m%d_%H%M%S')}.log"
             with dump_path.open("w", encoding="utf-8") as dump_file:
                 dump_file.write("\n========== THREAD DUMP BEGIN ==========\n")
                 dump_file.write(f"reason={reason}\n")
@@ -2151,24 +2966,27 @@ QPushButton:disabled {
                 dump_file.write(f"last_progress={getattr(self, '_dbg_last_progress', {})}\n")
                 dump_file.write(f"distribute_busy={getattr(self, '_distribute_busy', None)}\n")
                 dump_file.write(f"remote_pending_keys={list(getattr(self, '_remote_status_pending', {}).keys())}\n")
-                dump_file.write("threads:\n")
-                for th in threading.enumerate():
+                threads = threading.enumerate()
+                dump_file.write(f"threads: {len(threads)}\n")
+                for th in threads[:DBG_DUMP_MAX_THREADS]:
                     dump_file.write(
                         f"  - name={th.name} ident={th.ident} daemon={th.daemon} alive={th.is_alive()}\n"
                     )
+                if len(threads) > DBG_DUMP_MAX_THREADS:
+                    dump_file.write(f"  ... ({len(threads) - DBG_DUMP_MAX_THREADS} more)\n")
                 dump_file.write("\n-- stacktrace (all threads) --\n")
                 faulthandler.dump_traceback(file=dump_file, all_threads=True)
                 dump_file.write("\n========== THREAD DUMP END ==========\n")
-            logging.error("[DBG] thread dump saved: %s", dump_path)
+            logger.error("[DBG] thread dump saved: %s", dump_path)
         except Exception as exc:
             self._dbg_dump_failures += 1
             try:
-                logging.error("[DBG] dump failed: %s", exc)
+                logger.error("[DBG] dump failed: %s", exc)
             except Exception:
                 pass
             if self._dbg_dump_failures >= 3:
                 try:
-                    logging.error("[DBG] dump disabled after %d failures", self._dbg_dump_failures)
+                    logger.error("[DBG] dump disabled after %d failures", self._dbg_dump_failures)
                 except Exception:
                     pass
                 self._dbg_dump_enabled = False
@@ -2177,7 +2995,8 @@ QPushButton:disabled {
                     timer.stop()
 
     def _dbg_watchdog_tick(self) -> None:
-        if not getattr(self, "_dbg_enabled", False):
+        # タイマーは __init__ の設定読込後に動くので、属性は必ずある
+        if not (self._dbg_enabled and self._dbg_dump_enabled):
             return
         try:
             if not getattr(self, "_ui_busy", False):
@@ -2196,6 +3015,21 @@ QPushButton:disabled {
         except Exception:
             pass
 
+    def _queue_column_update(self, state: SignState) -> None:
+        with self._column_update_lock:
+            first = not self._column_update_pending
+            self._column_update_pending[state.name] = state
+        if first:
+            self._ui_call(self._flush_column_updates, label="column_updates")
+
+    def _flush_column_updates(self) -> None:
+        with self._column_update_lock:
+            pending = self._column_update_pending
+            self._column_update_pending = {}
+        for name in sorted(pending):
+            state = pending[name]
+            self._update_column(state.pc_index, state)
+
     def _ui_call(self, fn, label: str = "") -> None:
         def enqueue(callback):
             dispatcher = getattr(self, "_ui_dispatcher", None)
@@ -2218,7 +3052,7 @@ QPushButton:disabled {
                     except Exception:
                         pass
                     try:
-                        logging.exception("[DBG] ui_call failed label=%s", label or getattr(fn, "__name__", "fn"))
+                        logger.exception("[DBG] ui_call failed label=%s", label or getattr(fn, "__name__", "fn"))
                     except Exception:
                         pass
 
@@ -2260,7 +3094,7 @@ QPushButton:disabled {
             except Exception:
                 self._dbg_ui_post_fail += 1
                 try:
-                    logging.exception("[DBG] ui_call failed seq=%d label=%s", seq, label or getattr(fn, "__name__", "fn"))
+                    logger.exception("[DBG] ui_call failed seq=%d label=%s", seq, label or getattr(fn, "__name__", "fn"))
                 except Exception:
                     pass
 
@@ -2303,7 +3137,7 @@ QPushButton:disabled {
 
         def progress_token(token: str) -> None:
             if token:
-                logging.info("[PROG] %s %s", title, token)
+                logger.info("[PROG] %s %s", title, token)
                 try:
                     self._dbg_last_progress = {
                         "op_id": op_id,
@@ -2314,26 +3148,6 @@ QPushButton:disabled {
                 except Exception:
                     pass
 
-        def accepts_op_id() -> bool:
-            try:
-                sig = inspect.signature(worker_fn)
-            except (TypeError, ValueError):
-                return False
-            params = list(sig.parameters.values())
-            if any(p.kind == p.VAR_POSITIONAL for p in params):
-                return True
-            return len(params) >= 2
-
-        def accepts_cancel_event() -> bool:
-            try:
-                sig = inspect.signature(worker_fn)
-            except (TypeError, ValueError):
-                return False
-            params = list(sig.parameters.values())
-            if any(p.kind == p.VAR_POSITIONAL for p in params):
-                return True
-            return len(params) >= 3
-
         def finish_ok() -> None:
             self._dbg("finish_ok called op_id=%s title=%s", op_id, title)
             if finished.is_set():
@@ -2382,7 +3196,7 @@ QPushButton:disabled {
                 pending = len(getattr(self, "_dbg_ui_post_pending", {}))
                 last_dequeue = float(getattr(self, "_dbg_ui_post_last_dequeue_ts", 0.0) or 0.0)
                 last_enqueue = float(getattr(self, "_dbg_ui_post_last_enqueue_ts", 0.0) or 0.0)
-                logging.warning(
+                logger.warning(
                     "[DBG] ui timeout recovery pending=%d last_dequeue_ts=%.3f last_enqueue_ts=%.3f",
                     pending,
                     last_dequeue,
@@ -2400,9 +3214,10 @@ QPushButton:disabled {
             try:
                 self._dbg("runner start op_id=%s title=%s thread=%s", op_id, title, threading.current_thread().name)
                 args = [progress_token]
-                if accepts_op_id():
+                accepts_op_id, accepts_cancel_event = worker_arity(worker_fn)
+                if accepts_op_id:
                     args.append(op_id)
-                if accepts_cancel_event():
+                if accepts_cancel_event:
                     args.append(cancel_event)
                 self._dbg(
                     "worker enter op_id=%s title=%s fn=%s args_len=%d",
@@ -2427,36 +3242,39 @@ QPushButton:disabled {
         if not self.log_view:
             return trimmed
         width = max(10, self.log_view.viewport().width() - 10)
-        metrics = QtGui.QFontMetrics(self.log_view.font())
-        return metrics.elidedText(trimmed, QtCore.Qt.TextElideMode.ElideRight, width)
+        font = self.log_view.font()
+        if self._log_metrics is None or font != self._log_metrics_font:
+            self._log_metrics = QtGui.QFontMetrics(font)
+            self._log_metrics_font = font
+        return self._log_metrics.elidedText(trimmed, QtCore.Qt.TextElideMode.ElideRight, width)
 
     def _log_command_accept(self, label: str) -> None:
-        logging.info("[CMD] %s 受理", label)
+        logger.info("[CMD] %s 受理", label)
 
     def _log_command_run(self, label: str) -> None:
-        logging.info("[RUN] %s 実行中...", label)
+        logger.info("[RUN] %s 実行中...", label)
 
     def _log_command_done(self, label: str, ok_count: int, skip_count: int, err_count: int) -> None:
-        logging.info("[DONE] %s 完了 (OK=%d / SKIP=%d / ERR=%d)", label, ok_count, skip_count, err_count)
+        logger.info("[DONE] %s 完了 (OK=%d / SKIP=%d / ERR=%d)", label, ok_count, skip_count, err_count)
 
     def _log_sign_ok(self, state: SignState, message: str) -> None:
         suffix = f" {message}" if message else ""
-        logging.info("[OK] %s%s", state.name, suffix)
+        logger.info("[OK] %s%s", state.name, suffix)
 
     def _log_sign_skip(self, state: SignState, reason: str) -> None:
-        logging.info("[SKIP] %s %s", state.name, reason)
+        logger.info("[SKIP] %s %s", state.name, reason)
 
     def _log_sign_error(self, state: SignState, message: str) -> None:
-        logging.info("[ERR] %s %s", state.name, message)
+        logger.info("[ERR] %s %s", state.name, message)
 
     def _build_active_command_summary(self) -> str:
         parts = []
-        for state in sorted(self.sign_states.values(), key=lambda s: s.name):
+        for _name, state in self._sorted_sign_states:
             if not state.exists or not state.enabled:
                 continue
             ch = state.active_channel or "-"
             parts.append(f"{state.name}={ch}")
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ts = time_module.strftime("%Y-%m-%d %H:%M:%S")
         return f"[ACTIVE] {ts} " + " ".join(parts)
 
     def _append_active_write_error_ui(self, state: SignState, message: str) -> None:
@@ -2488,7 +3306,7 @@ QPushButton:disabled {
         info = self.inventory.get(state.name, {})
         info["enabled"] = state.enabled
         self.inventory[state.name] = info
-        write_json_atomic(INVENTORY_PATH, self.inventory)
+        write_json_atomic(INVENTORY_PATH, self.inventory, keep_backup=True)
 
     def _load_sign_states(self) -> None:
         for idx in range(1, N_SIGNAGE + 1):
@@ -2499,27 +3317,51 @@ QPushButton:disabled {
                 ip=info.get("ip", ""),
                 exists=info.get("exists", False),
                 share_name=info.get("share_name", "_TsuyamaSignage"),
+                column_key=f"Signage{idx:02d}",
+                pc_index=idx - 1,
             )
             state.enabled = info.get("enabled", True)
             self.sign_states[name] = state
+        # キー（Sign01..）も exists も inventory 読込時にしか変わらないので、ここで一覧を作っておく
+        self._sorted_sign_states = sorted(self.sign_states.items())
+        self._column_fp.clear()
+        self._existing_sign_names = sorted(name for name, state in self.sign_states.items() if state.exists)
 
     def refresh_summary(self) -> None:
-        for col, (name, state) in enumerate(sorted(self.sign_states.items())):
-            self._update_column(col, state)
+        update_column = self._update_column
+        for col, (name, state) in enumerate(self._sorted_sign_states):
+            update_column(col, state)
         self.update_ai_badge()
 
     def _update_column(self, col: int, state: SignState, update_preview: bool = True) -> None:
-        column = self._column_widgets.get(state.name.replace("Sign", "Signage"))
+        column = self._column_widgets.get(state.column_key)
         if not column:
             return
 
-        config = read_config(CONFIG_DIR / state.name)
-        column.display_label.setText(state.active_channel or "-")
-        column.sleep_label.setText(config.get("sleep_channel", "ch01"))
-        column.ai_lv2_label.setText(self._display_ai_channel(config.get("ai_channels", {}).get("level2")))
-        column.ai_lv3_label.setText(self._display_ai_channel(config.get("ai_channels", {}).get("level3")))
-        column.ai_lv4_label.setText(self._display_ai_channel(config.get("ai_channels", {}).get("level4")))
-        column.normal_label.setText(config.get("normal_channel", "ch05"))
+        # config.json が変わっていなければ stat 1 回で済ませる（読み取り専用で使う）
+        config, config_key = self._read_sign_config(state.name)
+        fp = (
+            state.exists,
+            state.enabled,
+            state.online,
+            bool(state.last_update),
+            state.active_channel,
+            config_key,
+        )
+        if self._column_fp.get(state.name) == fp:
+            # プレビューは自前で変化を見ているので、そちらだけ回す
+            if update_preview:
+                self.update_preview_cell(state, column)
+            return
+        self._column_fp[state.name] = fp
+
+        ai_channels = config.get("ai_channels", {})
+        set_text_if_changed(column.display_label, state.active_channel or "-")
+        set_text_if_changed(column.sleep_label, config.get("sleep_channel", "ch01"))
+        set_text_if_changed(column.ai_lv2_label, self._display_ai_channel(ai_channels.get("level2")))
+        set_text_if_changed(column.ai_lv3_label, self._display_ai_channel(ai_channels.get("level3")))
+        set_text_if_changed(column.ai_lv4_label, self._display_ai_channel(ai_channels.get("level4")))
+        set_text_if_changed(column.normal_label, config.get("normal_channel", "ch05"))
         column.timer_bar.set_rules(config.get("timer_rules", []))
         column.timer_bar.set_sleep_rules(config.get("sleep_rules", []))
 
@@ -2536,12 +3378,9 @@ QPushButton:disabled {
             online = state.online if state.last_update else None
             column.set_comm_status(True, online)
 
-        header_label = self._header_labels.get(state.name.replace("Sign", "Signage"))
+        header_label = self._header_labels.get(state.column_key)
         if header_label:
-            if inactive:
-                header_label.setStyleSheet("border: 1px solid #999; background-color: #c9c9c9; color: #7a7a7a;")
-            else:
-                header_label.setStyleSheet("border: 1px solid #999;")
+            apply_style_sheet(header_label, STYLE_CELL_INACTIVE if inactive else STYLE_CELL)
 
         if update_preview:
             self.update_preview_cell(state, column)
@@ -2564,11 +3403,17 @@ QPushButton:disabled {
         if not self.ai_level_badge:
             return
         level = extract_congestion_level(self.ai_status, default=1)
+        # レベルと STALE が前回と同じなら文字列も QSS も組み立て直さない
+        badge_state = (level, bool(self.ai_status_stale))
+        if badge_state == self._ai_badge_state:
+            return
+        self._ai_badge_state = badge_state
         style = level_style(level)
         label = style["label"] + (" (STALE)" if self.ai_status_stale else "")
-        self.ai_level_badge.setText(label)
-        self.ai_level_badge.setStyleSheet(
-            f"background:{style['bg']}; color:{style['fg']}; border-radius:8px; font-weight:900; font-size:16px;"
+        set_text_if_changed(self.ai_level_badge, label)
+        apply_style_sheet(
+            self.ai_level_badge,
+            f"background:{style['bg']}; color:{style['fg']}; border-radius:8px; font-weight:900; font-size:16px;",
         )
 
     def _display_ai_channel(self, value: Optional[str]) -> str:
@@ -2577,33 +3422,66 @@ QPushButton:disabled {
         return value or "-"
 
     def _tcp_probe(self, ip: str, port: int, timeout: float = 1.0) -> bool:
-        try:
-            with socket.create_connection((ip, port), timeout=timeout):
-                return True
-        except OSError:
-            return False
-
-    def _fast_smb_reachable(self, ip: str, timeout_sec: float = 0.2) -> bool:
+        key = (ip, port)
+        cached = self._tcp_cache.get(key)
+        if cached and time_module.monotonic() - cached[0] < TCP_PROBE_CACHE_SEC:
+            return cached[1]
+        ok = tcp_probe(ip, port, timeout)
+        self._tcp_cache[key] = (time_module.monotonic(), ok)
+        return ok
+
+    def _prefetch_reachability(self, states: List[SignState]) -> None:
         """
-        UNC(Path.exists/open)を触る前に、SMBポート(445)だけを短時間で確認する。
-        ここでNGならUNCアクセスしない（UNCは詰まりやすい）。
+        一括処理の前に対象全台へ ping をまとめて投げ、結果を is_share_reachable 用に控えておく。
         """
-        if not ip:
-            return False
-        return self._tcp_probe(ip, 445, timeout=timeout_sec)
+        ips = [state.ip for state in states if state.ip]
+        if not ips:
+            return
+        t0 = time_module.monotonic()
+        result = multi_reachable(ips)
+        now = time_module.monotonic()
+        for ip, ok in result.items():
+            self._ping_cache[ip] = (now, ok)
+        self._dbg("prefetch_reachability n=%d dt=%.3fs", len(ips), now - t0)
+
+    def _cached_is_reachable(self, ip: str) -> bool:
+        cached = self._ping_cache.get(ip)
+        if cached and time_module.monotonic() - cached[0] <= PING_CACHE_SEC:
+            return cached[1]
+        return is_reachable(ip)
 
     def is_share_reachable(self, state: SignState) -> Tuple[bool, str]:
+        # 連続する一括処理（配信→同期→ログ回収など）で毎回 SMB の接続確認をしない
+        cached = self._share_reach_cache.get(state.name)
+        if cached and time_module.monotonic() - cached[0] < SHARE_REACH_CACHE_SEC:
+            return cached[1], cached[2]
+        ok, msg = self._check_share_reachable(state)
+        self._share_reach_cache[state.name] = (time_module.monotonic(), ok, msg)
+        return ok, msg
+
+    def _invalidate_share_reachable(self, state: SignState) -> None:
+        self._share_reach_cache.pop(state.name, None)
+        self._tcp_cache.pop((state.ip, 445), None)
+        state.online_checked_at = 0.0
+
+    def _check_share_reachable(self, state: SignState) -> Tuple[bool, str]:
         t0 = time_module.monotonic()
         self._dbg("share_reachable start sign=%s ip=%s share=%s", state.name, state.ip, state.share_name)
-        ok_ping = is_reachable(state.ip)
-        self._dbg("share_reachable ping sign=%s ok=%s dt=%.3fs", state.name, ok_ping, time_module.monotonic() - t0)
-        if not ok_ping:
-            return False, "到達不可（ping）"
-        t1 = time_module.monotonic()
-        ok_tcp = self._tcp_probe(state.ip, 445, timeout=1.0)
-        self._dbg("share_reachable tcp445 sign=%s ok=%s dt=%.3fs", state.name, ok_tcp, time_module.monotonic() - t1)
-        if not ok_tcp:
-            return False, "到達不可（tcp445）"
+        # 直前の通信確認で tcp445 の結果が出ていれば、ping / tcp445 はやり直さない
+        if t0 - state.online_checked_at < CONNECTIVITY_FRESH_SEC:
+            if not state.online:
+                return False, "到達不可（通信確認）"
+            self._dbg("share_reachable recent_online sign=%s", state.name)
+        else:
+            ok_ping = self._cached_is_reachable(state.ip)
+            self._dbg("share_reachable ping sign=%s ok=%s dt=%.3fs", state.name, ok_ping, time_module.monotonic() - t0)
+            if not ok_ping:
+                return False, "到達不可（ping）"
+            t1 = time_module.monotonic()
+            ok_tcp = self._tcp_probe(state.ip, 445, timeout=1.0)
+            self._dbg("share_reachable tcp445 sign=%s ok=%s dt=%.3fs", state.name, ok_tcp, time_module.monotonic() - t1)
+            if not ok_tcp:
+                return False, "到達不可（tcp445）"
         root = build_unc_path(state.ip, state.share_name, "")
         try:
             t2 = time_module.monotonic()
@@ -2623,10 +3501,10 @@ QPushButton:disabled {
             if not state.exists or not state.enabled:
                 continue
             progress(state.name)
-            column = self._column_widgets.get(state.name.replace("Sign", "Signage"))
+            column = self._column_widgets.get(state.column_key)
             if not column:
                 continue
-            self._ui_call(lambda s=state, c=column: self.update_preview_cell(s, c))
+            self._ui_call(functools.partial(self.update_preview_cell, state, column), label="update_preview_cell")
 
     def toggle_preview(self) -> None:
         command = "プレビューON/OFF"
@@ -2647,7 +3525,7 @@ QPushButton:disabled {
         skip_count = 0
         err_count = 0
         for state in self.sign_states.values():
-            column = self._column_widgets.get(state.name.replace("Sign", "Signage"))
+            column = self._column_widgets.get(state.column_key)
             if not column:
                 continue
             if not state.exists:
@@ -2700,37 +3578,122 @@ QPushButton:disabled {
             column.show_preview_message(f"サンプル: {sample.name}")
             return
 
-        frame = self.read_sample_frame(sample)
-        if frame is None:
+        try:
+            mtime_ns = sample.stat().st_mtime_ns
+        except OSError:
             column.show_preview_message(f"サンプル: {sample.name}")
             return
-
-        height, width, _ = frame.shape
-        image = QtGui.QImage(frame.data, width, height, QtGui.QImage.Format_BGR888)
-        pixmap = QtGui.QPixmap.fromImage(image).scaled(
-            200, 120, QtCore.Qt.AspectRatioMode.KeepAspectRatio
+        key = f"preview:{sample}:{mtime_ns}"
+        # 同じサンプル（パス・更新時刻）を表示済み、またはデコード待ちなら何もしない
+        if column.preview_key == key:
+            return
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            column.show_preview_pixmap(pixmap)
+            column.preview_key = key
+            return
+        # デコードは UI スレッドでしない。出来上がるまでは名前だけ出しておく
+        column.show_preview_message(f"サンプル: {sample.name}")
+        column.preview_key = key
+        self._request_preview_image(sample, mtime_ns, key)
+
+    def _request_preview_image(self, sample: Path, mtime_ns: int, key: str) -> None:
+        # 同じサンプルを映す列が複数あっても、デコードは 1 回だけ
+        if key in self._preview_jobs:
+            return
+        future = self._executor.submit(self._compute_preview_image, sample, mtime_ns)
+        self._preview_jobs[key] = future
+        future.add_done_callback(
+            lambda f, k=key: self._ui_call(lambda: self._apply_preview_image(k, f), label="preview_image")
         )
-        column.show_preview_pixmap(pixmap)
+
+    def _compute_preview_image(self, sample: Path, mtime_ns: int) -> Optional[QtGui.QImage]:
+        # ワーカースレッドで実行する（QPixmap は UI スレッドでしか作れないので QImage まで）
+        # 以前に作った縮小 JPEG があれば、動画をデコードせずにそれを読む（起動直後の全列表示が軽くなる）
+        poster = preview_poster_path(sample, mtime_ns)
+        if poster.exists():
+            image = QtGui.QImage(str(poster))
+            if not image.isNull():
+                return image
+        image = self._decode_preview_image(sample)
+        if image is not None:
+            save_preview_poster(image, poster)
+        return image
+
+    def _decode_preview_image(self, sample: Path) -> Optional[QtGui.QImage]:
+        frame = self.read_sample_frame(sample)
+        if frame is None:
+            return None
+        # フル解像度のまま Qt に渡さず、先に cv2 で縮小してから 1 回だけ QImage にする
+        height, width = frame.shape[:2]
+        scale = min(PREVIEW_THUMB_WIDTH / width, PREVIEW_THUMB_HEIGHT / height, 1.0)
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame,
+                (max(1, int(width * scale)), max(1, int(height * scale))),
+                interpolation=cv2.INTER_AREA,
+            )
+            height, width = frame.shape[:2]
+        image = QtGui.QImage(frame.data, width, height, frame.strides[0], QtGui.QImage.Format.Format_BGR888)
+        # frame のバッファを参照したままにしないよう、ここで中身をコピーして切り離す
+        return image.copy()
+
+    def _apply_preview_image(self, key: str, future) -> None:
+        self._preview_jobs.pop(key, None)
+        try:
+            image = future.result()
+        except Exception as exc:
+            logger.info("[WARN] preview decode failed (%s): %s", key, exc)
+            return
+        if image is None or image.isNull():
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(key, pixmap)
+        # 待っている間に別のチャンネルやメッセージ表示へ切り替わった列には出さない
+        for column in self._column_widgets.values():
+            if column.preview_key == key:
+                column.show_preview_pixmap(pixmap)
+                column.preview_key = key
 
     def list_sample_videos(self, channel: str) -> List[Path]:
         path = CONTENT_DIR / channel
-        if not path.exists():
+        try:
+            dir_mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
             return []
+        # ファイル名だけで決まる一覧なので、フォルダの mtime（追加・削除・改名で変わる）が同じなら使い回す
+        cached = self._sample_list_cache.get(channel)
+        if cached and cached[0] == dir_mtime_ns:
+            return list(cached[1])
         samples: List[Path] = []
-        for entry in sorted(path.glob("*.mp4")):
-            if entry.is_file() and "sample" in entry.name.lower():
-                samples.append(entry)
-        return samples
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name.endswith(".mp4") and "sample" in name and entry.is_file():
+                        samples.append(Path(entry.path))
+        except OSError:
+            return []
+        samples.sort()
+        self._sample_list_cache[channel] = (dir_mtime_ns, samples)
+        return list(samples)
 
     def read_sample_frame(self, file_path: Path):
+        # 先頭 1 フレームだけ取れればよいので、grab で確認できたものだけ retrieve で変換する
+        # （同じファイルの再表示は update_preview_cell の preview_key 一致か QPixmapCache.find(key) で済むので、ここには来ない）
         capture = cv2.VideoCapture(str(file_path))
-        ok, frame = capture.read()
-        capture.release()
+        try:
+            if not capture.isOpened() or not capture.grab():
+                return None
+            ok, frame = capture.retrieve()
+        finally:
+            capture.release()
         if not ok:
             return None
         return frame
 
     def check_connectivity(self) -> None:
+        self.mark_connectivity_dirty()
         self.run_exclusive_task(
             "サイネージPC通信確認",
             self._task_check_connectivity,
@@ -2745,7 +3708,7 @@ QPushButton:disabled {
         targets = [state for state in self.sign_states.values() if state.exists and state.enabled]
         deadline_seconds = max(1.0, min(12.0, len(targets) * 0.6))
         deadline = time_module.time() + deadline_seconds
-        logging.info(
+        logger.info(
             "通信確認開始: 対象=%s台 timeout=%.2fs deadline=%.2fs",
             len(targets),
             timeout,
@@ -2771,16 +3734,15 @@ QPushButton:disabled {
                     except Exception as exc:
                         online, error, status_note = False, str(exc), ""
                     state.online = bool(online)
+                    state.online_checked_at = time_module.monotonic()
                     state.last_error = error or ""
-                    state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    state.last_update = now_stamp()
                     if status_note and online:
-                        logging.info("[WARN] %s 状態未取得 (%s)", state.name, status_note)
+                        logger.info("[WARN] %s 状態未取得 (%s)", state.name, status_note)
                     if op_id:
                         reason = error or ""
                         self._apply_pc_results(op_id, [self._build_pc_result(state, online, reason, "sent")])
-                    self._ui_call(
-                        lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s)
-                    )
+                    self._queue_column_update(state)
             except FuturesTimeoutError:
                 break
 
@@ -2791,17 +3753,23 @@ QPushButton:disabled {
                 progress(state.name)
                 state.online = False
                 state.last_error = "timeout"
-                state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                state.last_update = now_stamp()
                 if op_id:
                     self._apply_pc_results(
                         op_id,
                         [self._build_pc_result(state, False, state.last_error, "sent")],
                     )
-                self._ui_call(
-                    lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s)
-                )
+                self._queue_column_update(state)
+
+    def mark_connectivity_dirty(self) -> None:
+        self._connectivity_dirty = True
 
     def poll_connectivity_silent(self) -> None:
+        now_mono = time_module.monotonic()
+        if not self._connectivity_dirty and now_mono - self._connectivity_last_poll < self._connectivity_heartbeat:
+            return
+        self._connectivity_dirty = False
+        self._connectivity_last_poll = now_mono
         timeout = self.settings.get("network_timeout_seconds", 4)
         futures = {}
         for state in self.sign_states.values():
@@ -2809,30 +3777,40 @@ QPushButton:disabled {
                 if state.online:
                     state.online = False
                     state.last_error = ""
-                    state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    self._ui_call(lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s))
+                    state.last_update = now_stamp()
+                    self._queue_column_update(state)
                 continue
             futures[self._executor.submit(self.check_single_connectivity, state)] = state
 
-        for future, state in futures.items():
-            try:
-                online, error, status_note = future.result(timeout=timeout)
-            except FuturesTimeoutError:
-                online, error, status_note = False, "timeout", ""
-            except Exception as exc:
-                online, error, status_note = False, str(exc), ""
+        # 終わった順に回収し、待つのは全体で timeout 秒まで（1 台ずつ timeout 秒待たない）
+        results = []
+        pending = set(futures)
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                try:
+                    results.append((futures[future], True, future.result(timeout=0)))
+                except Exception as exc:
+                    results.append((futures[future], True, (False, str(exc), "")))
+        except FuturesTimeoutError:
+            pass
+        for future in pending:
+            results.append((futures[future], False, (False, "timeout", "")))
 
+        for state, checked, (online, error, status_note) in results:
+            if checked:
+                state.online_checked_at = time_module.monotonic()
             if online != state.online:
                 state.online = online
                 state.last_error = error or ""
-                state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                state.last_update = now_stamp()
                 if online:
-                    logging.info("[POLL] %s オンライン", state.name)
+                    logger.info("[POLL] %s オンライン", state.name)
                 else:
-                    logging.info("[POLL] %s オフライン (%s)", state.name, error or "offline")
-                self._ui_call(lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s))
+                    logger.info("[POLL] %s オフライン (%s)", state.name, error or "offline")
+                self._queue_column_update(state)
             if status_note and online:
-                logging.info("[POLL] %s 状態未取得 (%s)", state.name, status_note)
+                logger.info("[POLL] %s 状態未取得 (%s)", state.name, status_note)
 
     def check_single_connectivity(self, state: SignState) -> Tuple[bool, str, str]:
         if not self._tcp_probe(state.ip, 445, timeout=1.0):
@@ -2846,9 +3824,51 @@ QPushButton:disabled {
             status_note = str(exc)
         return True, "", status_note
 
+    def _read_sign_config(self, sign_name: str) -> Tuple[dict, str]:
+        """
+        config.json が前回から変わっていなければ、読み込み済みの設定とキャッシュキーを返す。
+        返す dict は共有されるので書き換えないこと。
+        """
+        sign_dir = CONFIG_DIR / sign_name
+        try:
+            fingerprint = stat_fingerprint(sign_dir / "config.json")
+        except OSError:
+            fingerprint = None
+        cached = self._sign_config_cache.get(sign_name)
+        if fingerprint is not None and cached and cached[0] == fingerprint:
+            return cached[1], cached[2]
+        config = read_config(sign_dir)
+        config_key = config_cache_key(config)
+        if fingerprint is not None:
+            self._sign_config_cache[sign_name] = (fingerprint, config, config_key)
+        else:
+            self._sign_config_cache.pop(sign_name, None)
+        return config, config_key
+
+    def _load_ai_status_if_changed(self) -> None:
+        try:
+            mtime_ns = os.stat(AI_STATUS_PATH).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None and mtime_ns == self._ai_status_loaded_mtime_ns:
+            return
+        self.ai_status = load_json(AI_STATUS_PATH, self.ai_status)
+        self._ai_status_loaded_mtime_ns = mtime_ns
+
     def recompute_all(self, auto_distribute: bool = True) -> None:
+        try:
+            updated_any = self._recompute_all_locked()
+        finally:
+            # 書込み失敗などで例外になっても、次の切替時刻の予約は必ずやり直す（単発タイマーが止まらないように）
+            self.transition_reschedule_requested.emit()
+
+        if auto_distribute and updated_any and self.settings.get("auto_distribute_on_event", False):
+            self.distribute_all()
+
+    def _recompute_all_locked(self) -> bool:
+        """各サインの active_channel を決め直す。表示中のチャンネルが変わったサインがあれば True。"""
         with self._update_lock:
-            self.ai_status = load_json(AI_STATUS_PATH, self.ai_status)
+            self._load_ai_status_if_changed()
             raw_level = self.ai_status.get("congestion_level", 1)
             updated_at_text = str(self.ai_status.get("updated_at", ""))
             updated_at_dt = parse_status_datetime(updated_at_text)
@@ -2857,7 +3877,7 @@ QPushButton:disabled {
             level = extract_congestion_level(self.ai_status, default=1)
             effective_level = 1 if is_stale else level
             self.ai_status_stale = is_stale
-            logging.info(
+            logger.info(
                 "[AI] congestion_level raw=%r level=%s updated_at=%s stale=%s",
                 raw_level,
                 level,
@@ -2871,24 +3891,28 @@ QPushButton:disabled {
             }
             updated_any = False
             for state in self.sign_states.values():
-                config = read_config(CONFIG_DIR / state.name)
                 if not state.exists or not state.enabled:
                     state.active_channel = None
                     continue
                 if self._emergency_override_enabled:
                     active_channel = self._emergency_override_channel
                 else:
-                    active_channel = compute_active_channel(config, effective_ai_status, now)
+                    config, config_key = self._read_sign_config(state.name)
+                    active_channel = compute_active_channel(
+                        config, effective_ai_status, now, config_key, sign_name=state.name
+                    )
                 if state.active_channel != active_channel:
                     updated_any = True
                 state.active_channel = active_channel
+                if state.name in self._active_written and self._active_written[state.name] == active_channel:
+                    continue
                 write_json_atomic(CONFIG_DIR / state.name / "active.json", {"active_channel": active_channel})
+                self._active_written[state.name] = active_channel
             self.refresh_summary()
-
-        if auto_distribute and updated_any and self.settings.get("auto_distribute_on_event", False):
-            self.distribute_all()
+        return updated_any
 
     def bulk_update(self) -> None:
+        self.mark_connectivity_dirty()
         self.run_exclusive_task("一斉Ch更新", self._task_bulk_update, detail="一斉更新 指示送信")
 
     def _task_bulk_update(self, progress) -> None:
@@ -2910,7 +3934,6 @@ QPushButton:disabled {
             return
 
         self._emergency_override_enabled = bool(enabled)
-        self._apply_emergency_button_style()
         detail = "指示送信中"
         self.run_exclusive_task(
             "最上位強制メッセージ切替中",
@@ -2950,6 +3973,7 @@ QPushButton:disabled {
             skip_count = 0
             err_count = 0
             results: List[dict] = []
+            targets: List[SignState] = []
             for state in self.sign_states.values():
                 if not state.exists:
                     skip_count += 1
@@ -2957,9 +3981,12 @@ QPushButton:disabled {
                 if not state.enabled:
                     skip_count += 1
                     continue
+                targets.append(state)
+            self._prefetch_reachability(targets)
+            for state in targets:
                 futures[self._executor.submit(self.distribute_active, state)] = state
 
-            logging.info(self._build_active_command_summary())
+            logger.info(self._build_active_command_summary())
 
             for future, state in futures.items():
                 try:
@@ -2969,7 +3996,7 @@ QPushButton:disabled {
                 except Exception as exc:
                     ok, message = False, str(exc)
                 state.last_error = message if not ok else ""
-                state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                state.last_update = now_stamp()
                 if ok:
                     ok_count += 1
                     results.append(self._build_pc_result(state, True, "", phase))
@@ -2981,14 +4008,14 @@ QPushButton:disabled {
                         if self._is_active_write_error(message):
                             err_count += 1
                             self._ui_call(
-                                lambda s=state, m=message: self._append_active_write_error_ui(s, m),
+                                functools.partial(self._append_active_write_error_ui, state, message),
                                 label=f"active_write_error:{state.name}",
                             )
                             results.append(self._build_pc_result(state, False, message, phase))
                         else:
                             skip_count += 1
                             results.append(self._build_pc_result(state, False, "skipped", phase))
-                self._ui_call(lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s))
+                self._queue_column_update(state)
             return results, ok_count, skip_count, err_count
         finally:
             self._distribute_busy = False
@@ -3009,6 +4036,7 @@ QPushButton:disabled {
             write_json_atomic_remote(Path(remote_path), active)
             return True, ""
         except Exception as exc:
+            self._invalidate_share_reachable(state)
             return False, f"{exc.__class__.__name__}: {exc} path={remote_path}"
 
     def start_sync(self) -> None:
@@ -3037,35 +4065,69 @@ QPushButton:disabled {
 
     def _task_sync_all(self, progress, op_id: Optional[str] = None) -> None:
         # 大容量動画で親側 timeout が先に出ることがあるため、動画同期専用 timeout を使う。
+        # sync_timeout_seconds は 1 台あたりの上限で、その端末の同期が実際に始まった時点から数える
+        # （同時実行は sync_workers 台までなので、順番待ちの時間は含めない）
         timeout = float(self.settings.get("sync_timeout_seconds", 600))
         timeout = max(60.0, min(timeout, 7200.0))
-        max_workers = self.settings.get("sync_workers", 4)
         futures = {}
         timeout_ui_only = False
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for state in self.sign_states.values():
-                if not state.exists or not state.enabled:
-                    continue
-                futures[executor.submit(self.sync_sign_content, state, progress)] = state
+        targets = [state for state in self.sign_states.values() if state.exists and state.enabled]
+        self._prefetch_reachability(targets)
+        # sign_name -> 同期開始時刻（monotonic）。ワーカー側で書き込む
+        started_at: Dict[str, float] = {}
 
-            results: List[dict] = []
-            for future, state in futures.items():
-                try:
-                    ok, message = future.result(timeout=timeout)
-                except FuturesTimeoutError:
-                    ok, message = False, "sync_timeout_ui_only"
+        def run_sync(state: SignState) -> Tuple[bool, str]:
+            started_at[state.name] = time_module.monotonic()
+            return self.sync_sign_content(state, progress)
+
+        for state in targets:
+            futures[self._sync_executor.submit(run_sync, state)] = state
+
+        results: List[dict] = []
+
+        def record(state: SignState, ok: bool, message: str) -> None:
+            state.last_error = message if not ok else ""
+            self._queue_column_update(state)
+            results.append(self._build_pc_result(state, ok, message or "", "sent"))
+            if not ok:
+                logger.warning("[ERR] %s 同期失敗 (%s)", state.name, message)
+
+        # 終わった端末から順に反映する（遅い 1 台の後ろで速い端末の表示を待たせない）。
+        # 各端末の期限は開始時刻 + timeout。まだ始まっていない端末は期限切れにしない
+        pending = set(futures)
+        while pending:
+            now = time_module.monotonic()
+            next_deadline = None
+            for future in list(pending):
+                start = started_at.get(futures[future].name)
+                if start is None or future.done():
+                    continue
+                deadline = start + timeout
+                if now >= deadline:
+                    pending.discard(future)
+                    state = futures[future]
                     timeout_ui_only = True
-                    logging.warning(
+                    logger.warning(
                         "[WARN] %s 動画同期タイムアウト表示: 転送継続中の可能性あり",
                         state.name,
                     )
+                    record(state, False, "sync_timeout_ui_only")
+                elif next_deadline is None or deadline < next_deadline:
+                    next_deadline = deadline
+            if not pending:
+                break
+            # 順番待ちの端末がいつ始まるかは分からないので、長くても 1 秒ごとに期限を見直す
+            wait_sec = 1.0 if next_deadline is None else min(1.0, max(0.0, next_deadline - now))
+            done, _ = wait(pending, timeout=wait_sec, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                try:
+                    ok, message = future.result()
                 except Exception as exc:
                     ok, message = False, str(exc)
-                state.last_error = message if not ok else ""
-                self._ui_call(lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s))
-                results.append(self._build_pc_result(state, ok, message or "", "sent"))
-                if not ok:
-                    logging.warning("[ERR] %s 同期失敗 (%s)", state.name, message)
+                record(futures[future], ok, message)
+        # 従来どおり、UI 上タイムアウトにした転送も終わるまでは同期中扱いにする（二重起動防止）
+        wait(futures)
 
         if timeout_ui_only:
             self._ui_call(
@@ -3083,7 +4145,7 @@ QPushButton:disabled {
         self._apply_pc_results(op_id or "", results)
 
     def sync_sign_content(self, state: SignState, progress_channel=None) -> Tuple[bool, str]:
-        logging.info("[RUN] %s 同期開始", state.name)
+        logger.info("[RUN] %s 同期開始", state.name)
         self._dbg("sync start sign=%s", state.name)
         t0 = time_module.monotonic()
         ok, msg = self.is_share_reachable(state)
@@ -3097,7 +4159,7 @@ QPushButton:disabled {
         total_errors = 0
 
         def log_line(text: str) -> None:
-            logging.info("%s", text)
+            logger.info("%s", text)
 
         for channel in CHANNELS:
             local_dir = CONTENT_DIR / channel
@@ -3116,6 +4178,7 @@ QPushButton:disabled {
                 str(remote_dir),
             )
             if not exists:
+                self._invalidate_share_reachable(state)
                 return False, f"remote content missing: {remote_content}"
             if progress_channel:
                 ch_num = channel.replace("ch", "").lstrip("0")
@@ -3125,6 +4188,8 @@ QPushButton:disabled {
                 local_dir,
                 remote_dir,
                 logger=log_line,
+                copy_workers=self.settings.get("sync_copy_workers", 4),
+                hash_check=bool(self.settings.get("sync_hash_check", False)),
             )
             self._dbg(
                 "sync ch=%s done sign=%s dt=%.3fs res=%s",
@@ -3138,7 +4203,7 @@ QPushButton:disabled {
             total_deleted += result["deleted"]
             total_skipped += result["skipped"]
             total_errors += result["errors"]
-        logging.info(
+        logger.info(
             "[DONE] %s 完了 ADD=%d UPD=%d DEL=%d SKIP=%d ERR=%d",
             state.name,
             total_copied,
@@ -3148,6 +4213,7 @@ QPushButton:disabled {
             total_errors,
         )
         if total_errors:
+            self._invalidate_share_reachable(state)
             return False, f"コピー/削除失敗({total_errors})"
         return True, ""
 
@@ -3158,9 +4224,9 @@ QPushButton:disabled {
         timeout = self.settings.get("network_timeout_seconds", 4)
         futures = {}
         results: List[dict] = []
-        for state in self.sign_states.values():
-            if not state.exists or not state.enabled:
-                continue
+        targets = [state for state in self.sign_states.values() if state.exists and state.enabled]
+        self._prefetch_reachability(targets)
+        for state in targets:
             futures[self._executor.submit(self.fetch_logs_for_sign, state)] = state
         for future, state in futures.items():
             progress(state.name)
@@ -3173,8 +4239,8 @@ QPushButton:disabled {
             state.last_error = message if not ok else ""
             results.append(self._build_pc_result(state, ok, message or "", "sent"))
             if not ok:
-                logging.warning("[ERR] %s LOG回収失敗 (%s)", state.name, message)
-            self._ui_call(lambda s=state: self._update_column(int(s.name.replace("Sign", "")) - 1, s))
+                logger.warning("[ERR] %s LOG回収失敗 (%s)", state.name, message)
+            self._queue_column_update(state)
         self._apply_pc_results(op_id or "", results)
 
     def fetch_logs_for_sign(self, state: SignState) -> Tuple[bool, str]:
@@ -3184,7 +4250,7 @@ QPushButton:disabled {
         self._dbg("fetch_logs share_check sign=%s ok=%s dt=%.3fs msg=%s", state.name, ok, time_module.monotonic() - t0, msg)
         if not ok:
             return False, msg
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time_module.strftime("%Y%m%d_%H%M%S")
         backup_root = Path(self.settings.get("log_backup_dir", str(ROOT_DIR.parent / "backup" / "logs")))
         dest = backup_root / state.name / timestamp
         ensure_dir(dest)
@@ -3204,11 +4270,27 @@ QPushButton:disabled {
             t2 = time_module.monotonic()
             copied = 0
             entries = 0
-            for entry in Path(remote_logs).iterdir():
-                entries += 1
-                if entry.is_file():
-                    shutil.copy2(entry, dest / entry.name)
+            # 1 ファイルずつ SMB の往復を待たず、共有 I/O プールで数本並列にコピーする
+            slots = threading.BoundedSemaphore(max(1, int(self.settings.get("log_copy_workers", LOG_COPY_WORKERS))))
+            futures = []
+            # scandir の一覧結果に種別・サイズ・時刻が含まれるので、ファイルごとに stat の往復をしない
+            with os.scandir(remote_logs) as it:
+                for entry in it:
+                    entries += 1
+                    if entry.is_file():
+                        slots.acquire()
+                        future = _IO_EXECUTOR.submit(copy_log_entry, entry, dest / entry.name)
+                        future.add_done_callback(lambda _f: slots.release())
+                        futures.append(future)
+            first_error: Optional[BaseException] = None
+            for future in futures:
+                exc = future.exception()
+                if exc is None:
                     copied += 1
+                elif first_error is None:
+                    first_error = exc
+            if first_error is not None:
+                raise first_error
             self._dbg(
                 "fetch_logs iterdir sign=%s files=%d copied=%d dt=%.3fs",
                 state.name,
@@ -3216,10 +4298,10 @@ QPushButton:disabled {
                 copied,
                 time_module.monotonic() - t2,
             )
-            logging.info("Logs fetched for %s", state.name)
+            logger.info("Logs fetched for %s", state.name)
             return True, ""
         except Exception as exc:
-            logging.exception("Failed log fetch for %s", state.name)
+            logger.exception("Failed log fetch for %s", state.name)
             return False, str(exc)
 
     def open_config_dialog(self, state: SignState) -> None:
@@ -3230,8 +4312,9 @@ QPushButton:disabled {
             new_config = dialog.get_config()
             if not new_config:
                 return
-            write_json_atomic(config_path, new_config)
-            logging.info("Config saved for %s", state.name)
+            write_json_atomic(config_path, new_config, keep_backup=True)
+            self._sign_config_cache.pop(state.name, None)
+            logger.info("Config saved for %s", state.name)
             self.recompute_all()
 
     def send_power_command(self, state: SignState, command: str) -> None:
@@ -3244,26 +4327,28 @@ QPushButton:disabled {
         )
         if confirm != QtWidgets.QMessageBox.StandardButton.Yes:
             return
+        self.mark_connectivity_dirty()
         op_id = self._log_op_start("電源操作", f"{state.name} {cmd_label} 指示送信（確認中）")
         ok, msg = self.is_share_reachable(state)
         if not ok:
             state.last_error = msg
-            self._update_column(int(state.name.replace("Sign", "")) - 1, state)
+            self._update_column(state.pc_index, state)
             self._log_op_error(op_id, msg)
             return
-        command_id = datetime.now().strftime("%Y%m%d_%H%M%S") + f"_{state.name}"
+        # 同じ秒に連打しても重ならないよう、起動中の通し番号を挟む
+        command_id = f"{int(time_module.time())}_{next(self._cmd_seq):06d}_{state.name}"
         payload = {
             "command_id": command_id,
             "action": command,
             "force": True,
-            "issued_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "issued_at": now_stamp(),
             "command": command,
             "by": "controller",
         }
         remote_path = build_unc_path(state.ip, state.share_name, f"{REMOTE_CONFIG_DIR}\\command.json")
         try:
-            write_json_atomic_remote(Path(remote_path), payload)
-            logging.info("Power command %s sent to %s", command, state.name)
+            write_json_atomic_remote(Path(remote_path), payload, fsync=True)
+            logger.info("Power command %s sent to %s", command, state.name)
             sign_no = state.name.replace("Sign", "")
             self._op_mark_ok(op_id, sign_no)
             self._pc_status_skip_until[state.name] = time_module.monotonic() + 60
@@ -3271,7 +4356,8 @@ QPushButton:disabled {
             def monitor_offline() -> None:
                 deadline = time_module.monotonic() + 120
                 while time_module.monotonic() < deadline:
-                    if not self._tcp_probe(state.ip, 445, timeout=1.0):
+                    # 落ちたことを見たいので、キャッシュは使わず毎回確認する
+                    if not tcp_probe(state.ip, 445, timeout=1.0):
                         self._ui_call(lambda oid=op_id: self._log_op_append(oid, " 実行確認OK"))
                         break
                     time_module.sleep(3)
@@ -3279,7 +4365,8 @@ QPushButton:disabled {
             self._log_op_done(op_id)
         except Exception as exc:
             state.last_error = str(exc)
-            self._update_column(int(state.name.replace("Sign", "")) - 1, state)
+            self._invalidate_share_reachable(state)
+            self._update_column(state.pc_index, state)
             self._log_op_error(op_id, str(exc))
 
     def _get_state_by_sign_name(self, sign_name: str) -> Optional[SignState]:
@@ -3301,33 +4388,28 @@ QPushButton:disabled {
             self.send_power_command(state, "shutdown")
 
     def log(self, message: str) -> None:
-        logging.info("%s", message)
+        logger.info("%s", message)
 
     def _on_column_active_toggle(self, sign_id: str, active: bool) -> None:
-        try:
-            pc_no = int(sign_id.replace("Sign", ""))
-        except ValueError:
-            logging.info("[ERROR] active toggle: invalid sign_id %s", sign_id)
-            return
-
+        self.mark_connectivity_dirty()
         state = self.sign_states.get(sign_id)
         if not state:
-            logging.info("[ERROR] active toggle: state missing %s", sign_id)
+            logger.info("[ERROR] active toggle: state missing %s", sign_id)
             return
         if state.enabled == active:
             return
 
         before_label = "アクティブ" if state.enabled else "非アクティブ"
         after_label = "アクティブ" if active else "非アクティブ"
-        logging.info("[CMD] %s %s->%s", state.name, before_label, after_label)
+        logger.info("[CMD] %s %s->%s", state.name, before_label, after_label)
         op_id = self._log_op_start("稼働設定", f"{state.name} {after_label} 指示送信")
 
         state.enabled = active
         self._save_inventory_state(state)
-        self._update_column(pc_no - 1, state, update_preview=False)
+        self._update_column(state.pc_index, state, update_preview=False)
         self._log_op_done(op_id)
 
-        column = self._column_widgets.get(sign_id.replace("Sign", "Signage"))
+        column = self._column_widgets.get(state.column_key)
         if column:
             if not active:
                 column.show_preview_message("非アクティブ")
@@ -3337,12 +4419,37 @@ QPushButton:disabled {
     def check_timer_transition(self) -> None:
         self.recompute_all()
 
+    def _schedule_next_transition(self) -> None:
+        now = datetime.now()
+        try:
+            configs = [
+                self._read_sign_config(state.name)[0]
+                for state in self.sign_states.values()
+                if state.exists and state.enabled
+            ]
+        except Exception:
+            logger.exception("[ERR] 次回切替時刻の算出に失敗 (%d 秒後に再計算)", TIMER_TRANSITION_RETRY_SEC)
+            self.timer_poll.start(TIMER_TRANSITION_RETRY_SEC * 1000)
+            return
+        # 終了時刻ちょうどは範囲内と判定されるので、境界の 1 秒後に起きる
+        wake_at = next_rule_boundary(configs, now) + timedelta(seconds=1)
+        delay = (wake_at - now).total_seconds()
+        if not self.ai_status_stale:
+            updated_at = parse_status_datetime(str(self.ai_status.get("updated_at", "")))
+            if updated_at is not None:
+                stale_in = (updated_at - now).total_seconds() + AI_STATUS_STALE_SEC + 1
+                if stale_in > 0:
+                    delay = min(delay, stale_in)
+        delay = min(max(delay, 1.0), float(TIMER_TRANSITION_MAX_WAIT_SEC))
+        self.timer_poll.start(int(delay * 1000))
+
     def schedule_recompute(self) -> None:
-        QtCore.QTimer.singleShot(0, self.recompute_all)
+        self._connectivity_dirty = True
+        self.recompute_requested.emit()
 
     def start_watchers(self) -> None:
         if not WATCHDOG_AVAILABLE:
-            logging.warning("watchdog not available, fallback to polling")
+            logger.warning("watchdog not available, fallback to polling")
             self.poll_ai_timer = QtCore.QTimer(self)
             self.poll_ai_timer.setInterval(60 * 1000)
             self.poll_ai_timer.timeout.connect(self.check_ai_status_polling)
@@ -3357,7 +4464,7 @@ QPushButton:disabled {
 
     def check_ai_status_polling(self) -> None:
         try:
-            mtime = AI_STATUS_PATH.stat().st_mtime
+            mtime = AI_STATUS_PATH.stat().st_mtime_ns
         except FileNotFoundError:
             mtime = None
         if self._ai_status_mtime is None:
@@ -3367,18 +4474,52 @@ QPushButton:disabled {
             self._ai_status_mtime = mtime
             self.schedule_recompute()
 
+    def _update_poll_cadence(self) -> None:
+        visible = self.isVisible() and not self.isMinimized()
+        if visible == self._ui_visible:
+            return
+        self._ui_visible = visible
+        interval = self.POLL_INTERVAL_MS if visible else self.POLL_INTERVAL_HIDDEN_MS
+        for timer in (self._telemetry_timer, self._connectivity_timer):
+            if timer is not None:
+                timer.setInterval(interval)
+        if visible:
+            # 隠れている間に省いた表示を、サインごとの最新値で全列まとめて戻す
+            deferred = self._pc_status_deferred
+            self._pc_status_deferred = {}
+            for name, payload in deferred.items():
+                state = self.sign_states.get(name)
+                if state is not None:
+                    self._set_pc_status_values(state, payload)
+            if self._telemetry_timer is not None:
+                QtCore.QTimer.singleShot(0, self.refresh_remote_telemetry)
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.Type.WindowStateChange:
+            self._update_poll_cadence()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_poll_cadence()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_poll_cadence()
+
     def closeEvent(self, event):
         if self._observer:
             self._observer.stop()
             self._observer.join()
         self._executor.shutdown(wait=False)
+        self._sync_executor.shutdown(wait=False)
         if self._log_handler:
             logging.getLogger().removeHandler(self._log_handler)
         super().closeEvent(event)
 
 
 def setup_logging():
-    log_path = LOG_DIR / f"controller_{datetime.now().strftime('%Y%m%d')}.log"
+    log_path = LOG_DIR / f"controller_{time_module.strftime('%Y%m%d')}.log"
     handler = logging.FileHandler(log_path, encoding="utf-8")
     handler.setLevel(logging.DEBUG)
     formatter = logging.Formatter("%(asctime)s [%(levelname)s] [%(threadName)s] %(message)s")
@@ -3388,6 +4529,9 @@ def setup_logging():
     root.setLevel(logging.DEBUG)
     root.handlers = []
     root.addHandler(handler)
+    # 書式で使わない PID / プロセス名を LogRecord ごとに取得しない（threadName は書式で使うので残す）
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
 
 def main():
@@ -3395,7 +4539,7 @@ def main():
         setup_logging()
     except Exception:
         pass
-    logging.info(
+    logger.info(
         "[BOOT] ROOT_DIR=%s CONFIG_DIR=%s REMOTE_CONFIG_DIR=%s CONTENT_DIR=%s LOG_DIR=%s",
         ROOT_DIR,
         CONFIG_DIR,
@@ -3413,6 +4557,7 @@ def main():
                 app.setStyle("windows")
             except Exception:
                 pass
+        QtGui.QPixmapCache.setCacheLimit(PREVIEW_PIXMAP_CACHE_KB)
         window = ControllerWindow()
         window.showMaximized()
         window.recompute_all()
@@ -3421,7 +4566,7 @@ def main():
         tb = traceback.format_exc()
         try:
             LOG_DIR.mkdir(parents=True, exist_ok=True)
-            crash = LOG_DIR / f"crash_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+            crash = LOG_DIR / f"crash_{time_module.strftime('%Y%m%d_%H%M%S')}.log"
             crash.write_text(tb, encoding="utf-8")
         except Exception:
             pass
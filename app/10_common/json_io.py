@@ -4,6 +4,26 @@ import time
 from pathlib import Path
 from typing import Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads_json(data: bytes | bytearray | memoryview | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps_json(data: Any, *, indent: int = 2, ensure_ascii: bool = False) -> bytes:
+    # orjson は indent=2 / 非ASCIIそのまま出力のみ対応。それ以外は標準 json に任せる
+    if orjson is not None and indent == 2 and not ensure_ascii:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=ensure_ascii, indent=indent).encode("utf-8")
+
 
 def write_json_safe(
     path: str | Path,
@@ -13,6 +33,7 @@ def write_json_safe(
     ensure_ascii: bool = False,
     retries: int = 10,
     base_delay: float = 0.2,
+    fsync: bool = True,
 ) -> Tuple[bool, int, Exception | None]:
     path_obj = Path(path)
     os.makedirs(path_obj.parent, exist_ok=True)
@@ -26,13 +47,18 @@ def write_json_safe(
 
     last_err: Exception | None = None
     attempts = max(1, int(retries))
+    try:
+        encoded = dumps_json(data, indent=indent, ensure_ascii=ensure_ascii)
+    except Exception as exc:
+        return False, attempts, exc
 
     for attempt in range(attempts):
         try:
-            with open(path_obj, "w", encoding="utf-8", newline="\n") as handle:
-                json.dump(data, handle, ensure_ascii=ensure_ascii, indent=indent)
-                handle.flush()
-                os.fsync(handle.fileno())
+            with open(path_obj, "wb") as handle:
+                handle.write(encoded)
+                if fsync:
+                    handle.flush()
+                    os.fsync(handle.fileno())
             return True, attempt, None
         except (PermissionError, OSError) as exc:
             last_err = exc